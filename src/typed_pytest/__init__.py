@@ -17,7 +17,13 @@ from typed_pytest._method import AsyncMockedMethod, MockedMethod
 from typed_pytest._mock import TypedMock
 from typed_pytest._mocker import TypedMocker
 from typed_pytest._property import MockedClassMethod, MockedProperty, MockedStaticMethod
-from typed_pytest._protocols import AsyncMockProtocol, MockProtocol
+from typed_pytest._protocols import (
+    AsyncMockProtocol,
+    MockProtocol,
+    is_async_mock_protocol,
+    is_mock,
+    is_mock_protocol,
+)
 from typed_pytest._version import __version__
 
 
@@ -32,5 +38,8 @@ __all__ = [
     "TypedMock",
     "TypedMocker",
     "__version__",
+    "is_async_mock_protocol",
+    "is_mock",
+    "is_mock_protocol",
     "typed_mock",
 ]
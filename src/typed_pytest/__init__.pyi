@@ -200,4 +200,8 @@ class AsyncMockProtocol(MockProtocol):
     @property
     def await_args_list(self) -> list[Any]: ...
 
+def is_mock(obj: object) -> bool: ...
+def is_mock_protocol(obj: object) -> bool: ...
+def is_async_mock_protocol(obj: object) -> bool: ...
+
 __version__: str
@@ -6,6 +6,7 @@ Factory function for creating type-safe Mock objects.
 
 from __future__ import annotations
 
+from abc import ABCMeta
 from typing import Any, TypeVar, overload
 
 from typed_pytest._mock import TypedMock
@@ -13,6 +14,10 @@ from typed_pytest._mock import TypedMock
 
 T = TypeVar("T")
 
+# Metaclasses of the overwhelmingly common spec classes. Checking identity
+# against these avoids the isinstance() fallback for plain classes and ABCs.
+_FAST_METACLASSES = (type, ABCMeta)
+
 
 @overload
 def typed_mock(cls: type[T], /) -> TypedMock[T]: ...
@@ -81,11 +86,10 @@ def typed_mock(
     # Validate that cls is a class (runtime type check)
     # Note: pyright already knows it's type[T] from the type hint,
     # but we need to validate at runtime since users can pass incorrect values
-    if not isinstance(cls, type):  # pyright: ignore[reportUnnecessaryIsInstance]
-        msg = f"typed_mock() argument must be a class, not {type(cls).__name__!r}"
-        raise TypeError(msg)
-
-    # Create TypedMock
-    if spec_set:
-        return TypedMock(spec_set=cls, name=name, **kwargs)
-    return TypedMock(spec=cls, name=name, **kwargs)
+    if type(cls) not in _FAST_METACLASSES and not isinstance(cls, type):  # pyright: ignore[reportUnnecessaryIsInstance]
+        raise TypeError(
+            f"typed_mock() argument must be a class, not {type(cls).__name__!r}"
+        )
+
+    # Create TypedMock (single call site; duplicate spec kwargs still raise)
+    return TypedMock(name=name, **{"spec_set" if spec_set else "spec": cls}, **kwargs)
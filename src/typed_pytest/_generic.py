@@ -0,0 +1,27 @@
+"""
+Runtime stand-in for typing.Generic.
+
+Type parameters of the mock wrappers only matter to type checkers. Modules
+import `typing.Generic` under TYPE_CHECKING and this class otherwise, so
+the runtime classes skip Generic's subclass hooks and subscription aliases.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class RuntimeGeneric:
+    """Base class that accepts and erases type subscriptions.
+
+    Example:
+        >>> class Box(RuntimeGeneric): ...
+        >>> Box[int] is Box
+        True
+    """
+
+    __slots__ = ()
+
+    def __class_getitem__(cls, params: Any) -> type:
+        """Returns the class itself; type parameters are erased at runtime."""
+        return cls
@@ -7,16 +7,79 @@ Provides Mock functionality while preserving the interface of the original type
 from __future__ import annotations
 
 import inspect
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 from unittest.mock import AsyncMock, MagicMock
+from weakref import WeakKeyDictionary
 
 
 if TYPE_CHECKING:
+    from typing import Generic
+
     from typed_pytest._method import AsyncMockedMethod, MockedMethod
+else:
+    # NonCallableMock.__new__ builds a subclass per instance; keeping
+    # typing.Generic out of the bases skips its __init_subclass__ each time.
+    from typed_pytest._generic import RuntimeGeneric as Generic
 
 
 T = TypeVar("T")
 
+# Spec introspection results per class: (class attribute snapshot, signature,
+# dir(spec), async attribute names, child mock factories).
+# MagicMock recomputes dir() and walks every attribute on each construction;
+# the snapshot detects classes modified since.
+_SPEC_CACHE: WeakKeyDictionary[
+    type,
+    tuple[
+        list[tuple[str, Any]],
+        Any,
+        list[str],
+        list[str],
+        dict[str, type[AsyncMock]],
+    ],
+] = WeakKeyDictionary()
+
+# Child mock factories for TypedMocks without a class spec (never mutated).
+_NO_CHILD_FACTORIES: dict[str, type[AsyncMock]] = {}
+
+
+def _class_attr_snapshot(spec: type) -> list[tuple[str, Any]]:
+    """Returns the (name, value) pairs defined along the MRO of `spec`."""
+    return [item for klass in spec.__mro__[:-1] for item in vars(klass).items()]
+
+
+def _snapshot_matches(
+    cached: list[tuple[str, Any]], current: list[tuple[str, Any]]
+) -> bool:
+    """Whether two snapshots hold the same names bound to identical values."""
+    return len(cached) == len(current) and all(
+        old_name == name and old_value is value
+        for (old_name, old_value), (name, value) in zip(cached, current, strict=True)
+    )
+
+
+def _child_mock_factories(spec: type) -> dict[str, type[AsyncMock]]:
+    """Maps the names that resolve to coroutine functions on `spec` to AsyncMock.
+
+    Like attribute lookup, the first class in the MRO defining a name wins.
+    Names missing from the mapping get a MagicMock child.
+    """
+    seen: set[str] = set()
+    factories: dict[str, type[AsyncMock]] = {}
+    for klass in spec.__mro__:
+        for name, attr in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            # Plain `async def` functions are recognized from their code flags;
+            # anything else (wrappers, markcoroutinefunction) goes to inspect.
+            code = getattr(attr, "__code__", None)
+            if (
+                code is not None and code.co_flags & inspect.CO_COROUTINE
+            ) or inspect.iscoroutinefunction(attr):
+                factories[name] = AsyncMock
+    return factories
+
 
 def _get_method_type_info(spec_class: type, name: str) -> dict[str, Any]:  # pyright: ignore[reportUnusedFunction, reportUnknownArgumentType]
     """Get method type information for type-safe mocking.
@@ -94,8 +157,13 @@ class TypedMock(MagicMock, Generic[T]):  # pyright: ignore[reportInconsistentCon
         Using the `typed_mock()` factory function is typically more convenient.
     """
 
-    # Declaring _typed_class as instance variable (conflict prevention with MagicMock)
-    __slots__ = ()
+    # The original class passed as the generic parameter. Kept in a slot and
+    # written with object.__setattr__ to bypass MagicMock's __setattr__.
+    __slots__ = ("_child_mock_factories", "_repr_cache", "typed_class")
+
+    typed_class: type[T] | None
+    _child_mock_factories: dict[str, type[AsyncMock]]
+    _repr_cache: tuple[type[T] | None, object, str]
 
     def __init__(
         self,
@@ -127,10 +195,52 @@ class TypedMock(MagicMock, Generic[T]):  # pyright: ignore[reportInconsistentCon
         if name is not None:
             kwargs["name"] = name
 
+        # Replaced by _mock_add_spec (run from MagicMock.__init__) for class specs
+        object.__setattr__(self, "_child_mock_factories", _NO_CHILD_FACTORIES)
+        object.__setattr__(self, "_repr_cache", (None, None, ""))
         super().__init__(**kwargs)
 
         # Store type information (bypass MagicMock's __setattr__)
-        object.__setattr__(self, "_typed_class", actual_spec)
+        object.__setattr__(self, "typed_class", actual_spec)
+
+    def _mock_add_spec(
+        self,
+        spec: Any,
+        spec_set: Any,
+        _spec_as_instance: bool = False,
+        _eat_self: bool = False,
+    ) -> None:
+        """Reuses cached spec introspection for plain class specs."""
+        if _spec_as_instance or _eat_self or not isinstance(spec, type):
+            super()._mock_add_spec(spec, spec_set, _spec_as_instance, _eat_self)
+            return
+
+        snapshot = _class_attr_snapshot(spec)
+        cached = _SPEC_CACHE.get(spec)
+        if cached is None or not _snapshot_matches(cached[0], snapshot):
+            super()._mock_add_spec(spec, spec_set, _spec_as_instance, _eat_self)
+            __dict__ = self.__dict__
+            factories = _child_mock_factories(spec)
+            _SPEC_CACHE[spec] = (
+                snapshot,
+                __dict__["_spec_signature"],
+                list(__dict__["_mock_methods"]),
+                list(__dict__["_spec_asyncs"]),
+                factories,
+            )
+            object.__setattr__(self, "_child_mock_factories", factories)
+            return
+
+        # A list spec makes the stock implementation skip dir() and the
+        # attribute walk; the class-derived fields are then filled in from
+        # the cache. TestTypedMockSpecCache checks the result against MagicMock.
+        _, signature, methods, asyncs, factories = cached
+        super()._mock_add_spec(methods.copy(), spec_set)
+        object.__setattr__(self, "_child_mock_factories", factories)
+        __dict__ = self.__dict__
+        __dict__["_spec_class"] = spec
+        __dict__["_spec_signature"] = signature
+        __dict__["_spec_asyncs"] = asyncs.copy()
 
     if TYPE_CHECKING:
         # Only visible to type checkers
@@ -142,32 +252,25 @@ class TypedMock(MagicMock, Generic[T]):  # pyright: ignore[reportInconsistentCon
 
     def _get_child_mock(self, **kwargs: Any) -> MagicMock:
         """Returns AsyncMock for async methods when creating child Mocks."""
-        name = kwargs.get("name")
-        if name and self.typed_class is not None:
-            for cls in self.typed_class.__mro__:
-                if name in cls.__dict__:
-                    attr = cls.__dict__[name]
-                    if inspect.iscoroutinefunction(attr):
-                        return AsyncMock(**kwargs)
-                    break
-        return MagicMock(**kwargs)
-
-    @property
-    def typed_class(self) -> type[T] | None:
-        """The original class passed as the generic parameter."""
-        result: type[T] | None = object.__getattribute__(self, "_typed_class")
-        return result
+        factory = self._child_mock_factories.get(kwargs.get("name", ""), MagicMock)
+        return factory(**kwargs)
 
     def __repr__(self) -> str:
-        """String representation of TypedMock."""
-        typed_class = object.__getattribute__(self, "_typed_class")
-        name = self._mock_name
-
-        if typed_class is not None:
-            if name:
-                return f"<TypedMock[{typed_class.__name__}] name='{name}'>"
-            return f"<TypedMock[{typed_class.__name__}] id='{id(self)}'>"
+        """String representation of TypedMock.
 
-        if name:
-            return f"<TypedMock name='{name}'>"
-        return f"<TypedMock id='{id(self)}'>"
+        Cached until typed_class or the Mock's name changes.
+        """
+        typed_class = self.typed_class
+        name = self._mock_name
+        cached_class, cached_name, cached = self._repr_cache
+        if cached and cached_class is typed_class and cached_name == name:
+            return cached
+
+        label = (
+            f"TypedMock[{typed_class.__name__}]"
+            if typed_class is not None
+            else "TypedMock"
+        )
+        result = f"<{label} name='{name}'>" if name else f"<{label} id='{id(self)}'>"
+        object.__setattr__(self, "_repr_cache", (typed_class, name, result))
+        return result
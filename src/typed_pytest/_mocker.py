@@ -6,7 +6,7 @@ Wraps pytest-mock's MockerFixture to provide type-safe mock functionality.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
+from typing import TYPE_CHECKING, Any, TypeVar, overload
 
 from typed_pytest._factory import typed_mock
 from typed_pytest._method import MockedMethod
@@ -56,7 +56,7 @@ class TypedMocker:
         to use the original MockerFixture.
     """
 
-    __slots__ = ("_mocker",)
+    __slots__ = ("_mocker", "_patch", "_patch_dict", "_patch_object", "_spy")
 
     def __init__(self, mocker: MockerFixture) -> None:
         """Creates a TypedMocker instance.
@@ -65,6 +65,11 @@ class TypedMocker:
             mocker: pytest-mock's MockerFixture instance.
         """
         self._mocker = mocker
+        # Bound once so each wrapper call skips the _Patcher attribute chain.
+        self._patch = mocker.patch
+        self._patch_object = mocker.patch.object
+        self._patch_dict = mocker.patch.dict
+        self._spy = mocker.spy
 
     def mock(self, cls: type[T], /, **kwargs: Any) -> TypedMock[T]:
         """Creates a type-safe Mock object.
@@ -140,9 +145,8 @@ class TypedMocker:
                 >>> mock.return_value = {"id": 1}
         """
         if new is not None:
-            mock_instance = typed_mock(new)
-            return self._mocker.patch(target, mock_instance, **kwargs)
-        return cast("MagicMock", self._mocker.patch(target, **kwargs))
+            return self._patch(target, typed_mock(new), **kwargs)
+        return self._patch(target, **kwargs)  # type: ignore[no-any-return]
 
     def spy(self, obj: object, name: str) -> MockedMethod[..., Any]:
         """Spies on a method of a real object.
@@ -162,8 +166,7 @@ class TypedMocker:
             >>> service.get_user(1)  # Executes original method
             >>> spy.assert_called_once_with(1)
         """
-        spy_mock = self._mocker.spy(obj, name)
-        return MockedMethod(spy_mock)
+        return MockedMethod(self._spy(obj, name))
 
     @overload
     def patch_object(  # pyright: ignore[reportOverlappingOverload]
@@ -212,9 +215,8 @@ class TypedMocker:
             '/mocked/path'
         """
         if new is not None:
-            mock_instance = typed_mock(new)
-            return self._mocker.patch.object(target, attribute, mock_instance, **kwargs)
-        return cast("MagicMock", self._mocker.patch.object(target, attribute, **kwargs))
+            return self._patch_object(target, attribute, typed_mock(new), **kwargs)
+        return self._patch_object(target, attribute, **kwargs)
 
     def patch_dict(
         self,
@@ -242,12 +244,9 @@ class TypedMocker:
             >>> os.environ["MY_VAR"]
             'test'
         """
-        if values is None:
-            values = {}
-        return cast(
-            "dict[str, Any]",
-            self._mocker.patch.dict(in_dict, values, clear=clear, **kwargs),
-        )
+        # patch.dict's own default is an empty tuple; no need to build a dict.
+        new_values = () if values is None else values
+        return self._patch_dict(in_dict, new_values, clear=clear, **kwargs)  # type: ignore[no-any-return]  # pyright: ignore[reportUnknownVariableType]
 
     @property
     def mocker(self) -> MockerFixture:
@@ -256,6 +255,8 @@ class TypedMocker:
         Use when you need features not provided by TypedMocker.
         (e.g., resetall(), stopall(), stub(), patch.dict(), etc.)
 
+        Read-only: the patch and spy wrappers are bound to this fixture.
+
         Returns:
             The original MockerFixture instance.
 
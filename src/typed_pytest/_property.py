@@ -9,12 +9,17 @@ Provides type-safe mocking for:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Generic, ParamSpec, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+from typed_pytest._method import _MockMethodBase  # pyright: ignore[reportPrivateUsage]
 
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from typing import Generic
     from unittest.mock import MagicMock
+else:
+    from typed_pytest._generic import RuntimeGeneric as Generic
 
 
 P = ParamSpec("P")
@@ -39,7 +44,15 @@ class MockedProperty(Generic[R]):
         but is automatically created through TypedMock[T].
     """
 
-    __slots__ = ("_mock",)
+    __slots__ = (
+        "_assert_any_call",
+        "_assert_called",
+        "_assert_called_once",
+        "_assert_called_once_with",
+        "_assert_called_with",
+        "_assert_not_called",
+        "_mock",
+    )
 
     def __init__(self, mock: MagicMock) -> None:
         """Creates a MockedProperty instance.
@@ -47,7 +60,15 @@ class MockedProperty(Generic[R]):
         Args:
             mock: The MagicMock instance to wrap.
         """
-        object.__setattr__(self, "_mock", mock)
+        # Hot Mock methods are bound once here instead of on every call.
+        setattr_ = object.__setattr__
+        setattr_(self, "_mock", mock)
+        setattr_(self, "_assert_called", mock.assert_called)
+        setattr_(self, "_assert_called_once", mock.assert_called_once)
+        setattr_(self, "_assert_called_with", mock.assert_called_with)
+        setattr_(self, "_assert_called_once_with", mock.assert_called_once_with)
+        setattr_(self, "_assert_any_call", mock.assert_any_call)
+        setattr_(self, "_assert_not_called", mock.assert_not_called)
 
     # =========================================================================
     # Property interface
@@ -59,7 +80,7 @@ class MockedProperty(Generic[R]):
 
         Type checkers recognize the original property's return type R.
         """
-        return cast("R", self._mock.return_value)
+        return self._mock.return_value  # type: ignore[no-any-return]
 
     @return_value.setter
     def return_value(self, value: R) -> None:
@@ -103,23 +124,26 @@ class MockedProperty(Generic[R]):
     @property
     def call_count(self) -> int:
         """Number of times the property was accessed."""
-        return cast("int", self._mock.call_count)
+        return self._mock.call_count  # type: ignore[no-any-return]
 
     @property
     def called(self) -> bool:
         """Whether the property was accessed at least once."""
-        return cast("bool", self._mock.called)
+        return self._mock.called  # type: ignore[no-any-return]
 
     @property
     def call_args(self) -> Any:
         """Arguments of the last access. None if never accessed."""
-        return cast("Any", self._mock.call_args)
+        return self._mock.call_args  # pyright: ignore[reportUnknownVariableType]
 
     @property
     def call_args_list(self) -> list[Any]:
-        """List of arguments for all accesses."""
-        result: list[Any] = list(self._mock.call_args_list)
-        return result
+        """List of arguments for all accesses.
+
+        This is the Mock's own list, not a copy, so it keeps growing with
+        later accesses.
+        """
+        return self._mock.call_args_list  # type: ignore[no-any-return]
 
     # =========================================================================
     # Assertion methods
@@ -131,7 +155,7 @@ class MockedProperty(Generic[R]):
         Raises:
             AssertionError: If never accessed.
         """
-        self._mock.assert_called()
+        self._assert_called()
 
     def assert_called_once(self) -> None:
         """Verifies that the property was accessed exactly once.
@@ -139,7 +163,7 @@ class MockedProperty(Generic[R]):
         Raises:
             AssertionError: If access count is not 1.
         """
-        self._mock.assert_called_once()
+        self._assert_called_once()
 
     def assert_called_with(self, *args: Any, **kwargs: Any) -> None:
         """Verifies that the property was accessed with the specified arguments.
@@ -151,7 +175,7 @@ class MockedProperty(Generic[R]):
         Raises:
             AssertionError: If the last access's arguments don't match.
         """
-        self._mock.assert_called_with(*args, **kwargs)
+        self._assert_called_with(*args, **kwargs)
 
     def assert_called_once_with(self, *args: Any, **kwargs: Any) -> None:
         """Verifies that the property was accessed exactly once with specified arguments.
@@ -163,7 +187,7 @@ class MockedProperty(Generic[R]):
         Raises:
             AssertionError: If access count is not 1 or arguments don't match.
         """
-        self._mock.assert_called_once_with(*args, **kwargs)
+        self._assert_called_once_with(*args, **kwargs)
 
     def assert_any_call(self, *args: Any, **kwargs: Any) -> None:
         """Verifies that the property was accessed with specified arguments at least once.
@@ -175,7 +199,7 @@ class MockedProperty(Generic[R]):
         Raises:
             AssertionError: If never accessed with those arguments.
         """
-        self._mock.assert_any_call(*args, **kwargs)
+        self._assert_any_call(*args, **kwargs)
 
     def assert_not_called(self) -> None:
         """Verifies that the property was never accessed.
@@ -183,7 +207,7 @@ class MockedProperty(Generic[R]):
         Raises:
             AssertionError: If accessed at least once.
         """
-        self._mock.assert_not_called()
+        self._assert_not_called()
 
     def reset_mock(
         self,
@@ -212,22 +236,31 @@ class MockedProperty(Generic[R]):
         Returns:
             The corresponding attribute from the internal Mock.
         """
+        if name.startswith("__") and name.endswith("__"):
+            # Dunder probes from copy/inspect/pytest only need what the Mock
+            # really has; skip MagicMock.__getattr__ and its spec checks.
+            return object.__getattribute__(self._mock, name)
         return getattr(self._mock, name)
 
+    def __dir__(self) -> list[str]:
+        """Lists the wrapper's members and the Mock's public attributes.
+
+        Without this, object.__dir__ reads the Mock's __dict__ through
+        __getattr__ and lists its private state instead of its children.
+        """
+        return sorted({*dir(type(self)), *dir(self._mock)})
+
     def __setattr__(self, name: str, value: Any) -> None:
-        """Delegates attribute setting to the internal Mock or this instance.
+        """Delegates attribute setting to the internal Mock.
 
         Args:
             name: Attribute name.
             value: Value to set.
         """
-        if name == "_mock":
-            object.__setattr__(self, name, value)
-        else:
-            setattr(self._mock, name, value)
+        setattr(self._mock, name, value)
 
 
-class MockedClassMethod(Generic[P, R]):
+class MockedClassMethod(_MockMethodBase[P, R]):
     """Mock wrapper for class methods.
 
     Preserves the class method signature where cls is passed automatically.
@@ -244,19 +277,7 @@ class MockedClassMethod(Generic[P, R]):
         but is automatically created through TypedMock[T].
     """
 
-    __slots__ = ("_mock",)
-
-    def __init__(self, mock: MagicMock) -> None:
-        """Creates a MockedClassMethod instance.
-
-        Args:
-            mock: The MagicMock instance to wrap.
-        """
-        object.__setattr__(self, "_mock", mock)
-
-    # =========================================================================
-    # Callable interface
-    # =========================================================================
+    __slots__ = ()
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
         """Calls with the same signature as the original class method.
@@ -268,203 +289,10 @@ class MockedClassMethod(Generic[P, R]):
         Returns:
             The Mock's return_value or side_effect result.
         """
-        return self._mock(*args, **kwargs)  # type: ignore[no-any-return]
-
-    # =========================================================================
-    # Assertion methods
-    # =========================================================================
-
-    def assert_called(self) -> None:
-        """Verifies that the Mock was called at least once.
-
-        Raises:
-            AssertionError: If never called.
-        """
-        self._mock.assert_called()
-
-    def assert_called_once(self) -> None:
-        """Verifies that the Mock was called exactly once.
-
-        Raises:
-            AssertionError: If call count is not 1.
-        """
-        self._mock.assert_called_once()
-
-    def assert_called_with(self, *args: P.args, **kwargs: P.kwargs) -> None:
-        """Verifies that the Mock was called with the specified arguments (last call).
-
-        Type checkers validate against the original method's parameter types.
-
-        Args:
-            *args: Expected positional arguments (original method signature).
-            **kwargs: Expected keyword arguments (original method signature).
-
-        Raises:
-            AssertionError: If the last call's arguments don't match.
-        """
-        self._mock.assert_called_with(*args, **kwargs)
-
-    def assert_called_once_with(self, *args: P.args, **kwargs: P.kwargs) -> None:
-        """Verifies that the Mock was called exactly once with the specified arguments.
-
-        Type checkers validate against the original method's parameter types.
-
-        Args:
-            *args: Expected positional arguments (original method signature).
-            **kwargs: Expected keyword arguments (original method signature).
-
-        Raises:
-            AssertionError: If call count is not 1 or arguments don't match.
-        """
-        self._mock.assert_called_once_with(*args, **kwargs)
-
-    def assert_any_call(self, *args: P.args, **kwargs: P.kwargs) -> None:
-        """Verifies that the Mock was called with the specified arguments at least once.
-
-        Type checkers validate against the original method's parameter types.
-
-        Args:
-            *args: Expected positional arguments (original method signature).
-            **kwargs: Expected keyword arguments (original method signature).
-
-        Raises:
-            AssertionError: If never called with those arguments.
-        """
-        self._mock.assert_any_call(*args, **kwargs)
-
-    def assert_not_called(self) -> None:
-        """Verifies that the Mock was never called.
-
-        Raises:
-            AssertionError: If called at least once.
-        """
-        self._mock.assert_not_called()
-
-    def assert_has_calls(
-        self,
-        calls: list[Any],
-        any_order: bool = False,
-    ) -> None:
-        """Verifies that the Mock was called with the specified list of calls.
-
-        Args:
-            calls: Expected list of calls (unittest.mock.call objects).
-            any_order: If True, order is ignored; if False, order must match.
-
-        Raises:
-            AssertionError: If the call list doesn't match.
-        """
-        self._mock.assert_has_calls(calls, any_order=any_order)
-
-    def reset_mock(
-        self,
-        *,
-        return_value: bool = False,
-        side_effect: bool = False,
-    ) -> None:
-        """Resets the Mock's call history.
-
-        Args:
-            return_value: If True, also resets return_value.
-            side_effect: If True, also resets side_effect.
-        """
-        self._mock.reset_mock(return_value=return_value, side_effect=side_effect)
-
-    # =========================================================================
-    # Properties
-    # =========================================================================
-
-    @property
-    def return_value(self) -> R:
-        """Value to return when the Mock is called.
-
-        Type checkers recognize the original method's return type R.
-        """
-        return cast("R", self._mock.return_value)
-
-    @return_value.setter
-    def return_value(self, value: R) -> None:
-        """Sets the value to return when the Mock is called.
-
-        Type checkers validate against the original method's return type R.
-
-        Args:
-            value: The return value to set (type R).
-        """
-        self._mock.return_value = value
-
-    @property
-    def side_effect(self) -> Callable[P, R] | BaseException | list[Any] | None:
-        """Side effect to raise when the Mock is called.
-
-        - Callable: Function to execute when called (original signature P -> R).
-        - Exception: Exception to raise when called.
-        - list: List of values to return sequentially.
-        - None: No side effect (use return_value).
-        """
-        return self._mock.side_effect  # type: ignore[no-any-return]
-
-    @side_effect.setter
-    def side_effect(
-        self, value: Callable[P, R] | BaseException | list[Any] | None
-    ) -> None:
-        """Sets the side effect to raise when the Mock is called.
-
-        Args:
-            value: The side effect (function, exception, list of values, or None).
-        """
-        self._mock.side_effect = value
-
-    @property
-    def call_count(self) -> int:
-        """Number of times the Mock was called."""
-        return cast("int", self._mock.call_count)
-
-    @property
-    def called(self) -> bool:
-        """Whether the Mock was called at least once."""
-        return cast("bool", self._mock.called)
-
-    @property
-    def call_args(self) -> Any:
-        """Arguments of the last call. None if never called."""
-        return cast("Any", self._mock.call_args)
-
-    @property
-    def call_args_list(self) -> list[Any]:
-        """List of arguments for all calls."""
-        result: list[Any] = list(self._mock.call_args_list)
-        return result
-
-    # =========================================================================
-    # Attribute access delegation
-    # =========================================================================
-
-    def __getattr__(self, name: str) -> Any:
-        """Delegates undefined attributes to the internal Mock.
-
-        Args:
-            name: Attribute name.
-
-        Returns:
-            The corresponding attribute from the internal Mock.
-        """
-        return getattr(self._mock, name)
-
-    def __setattr__(self, name: str, value: Any) -> None:
-        """Delegates attribute setting to the internal Mock or this instance.
-
-        Args:
-            name: Attribute name.
-            value: Value to set.
-        """
-        if name == "_mock":
-            object.__setattr__(self, name, value)
-        else:
-            setattr(self._mock, name, value)
+        return self._call(*args, **kwargs)  # type: ignore[no-any-return]
 
 
-class MockedStaticMethod(Generic[P, R]):
+class MockedStaticMethod(_MockMethodBase[P, R]):
     """Mock wrapper for static methods.
 
     Preserves the static method signature (no self/cls).
@@ -481,19 +309,7 @@ class MockedStaticMethod(Generic[P, R]):
         but is automatically created through TypedMock[T].
     """
 
-    __slots__ = ("_mock",)
-
-    def __init__(self, mock: MagicMock) -> None:
-        """Creates a MockedStaticMethod instance.
-
-        Args:
-            mock: The MagicMock instance to wrap.
-        """
-        object.__setattr__(self, "_mock", mock)
-
-    # =========================================================================
-    # Callable interface
-    # =========================================================================
+    __slots__ = ()
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
         """Calls with the same signature as the original static method.
@@ -505,197 +321,4 @@ class MockedStaticMethod(Generic[P, R]):
         Returns:
             The Mock's return_value or side_effect result.
         """
-        return self._mock(*args, **kwargs)  # type: ignore[no-any-return]
-
-    # =========================================================================
-    # Assertion methods
-    # =========================================================================
-
-    def assert_called(self) -> None:
-        """Verifies that the Mock was called at least once.
-
-        Raises:
-            AssertionError: If never called.
-        """
-        self._mock.assert_called()
-
-    def assert_called_once(self) -> None:
-        """Verifies that the Mock was called exactly once.
-
-        Raises:
-            AssertionError: If call count is not 1.
-        """
-        self._mock.assert_called_once()
-
-    def assert_called_with(self, *args: P.args, **kwargs: P.kwargs) -> None:
-        """Verifies that the Mock was called with the specified arguments (last call).
-
-        Type checkers validate against the original method's parameter types.
-
-        Args:
-            *args: Expected positional arguments (original method signature).
-            **kwargs: Expected keyword arguments (original method signature).
-
-        Raises:
-            AssertionError: If the last call's arguments don't match.
-        """
-        self._mock.assert_called_with(*args, **kwargs)
-
-    def assert_called_once_with(self, *args: P.args, **kwargs: P.kwargs) -> None:
-        """Verifies that the Mock was called exactly once with the specified arguments.
-
-        Type checkers validate against the original method's parameter types.
-
-        Args:
-            *args: Expected positional arguments (original method signature).
-            **kwargs: Expected keyword arguments (original method signature).
-
-        Raises:
-            AssertionError: If call count is not 1 or arguments don't match.
-        """
-        self._mock.assert_called_once_with(*args, **kwargs)
-
-    def assert_any_call(self, *args: P.args, **kwargs: P.kwargs) -> None:
-        """Verifies that the Mock was called with the specified arguments at least once.
-
-        Type checkers validate against the original method's parameter types.
-
-        Args:
-            *args: Expected positional arguments (original method signature).
-            **kwargs: Expected keyword arguments (original method signature).
-
-        Raises:
-            AssertionError: If never called with those arguments.
-        """
-        self._mock.assert_any_call(*args, **kwargs)
-
-    def assert_not_called(self) -> None:
-        """Verifies that the Mock was never called.
-
-        Raises:
-            AssertionError: If called at least once.
-        """
-        self._mock.assert_not_called()
-
-    def assert_has_calls(
-        self,
-        calls: list[Any],
-        any_order: bool = False,
-    ) -> None:
-        """Verifies that the Mock was called with the specified list of calls.
-
-        Args:
-            calls: Expected list of calls (unittest.mock.call objects).
-            any_order: If True, order is ignored; if False, order must match.
-
-        Raises:
-            AssertionError: If the call list doesn't match.
-        """
-        self._mock.assert_has_calls(calls, any_order=any_order)
-
-    def reset_mock(
-        self,
-        *,
-        return_value: bool = False,
-        side_effect: bool = False,
-    ) -> None:
-        """Resets the Mock's call history.
-
-        Args:
-            return_value: If True, also resets return_value.
-            side_effect: If True, also resets side_effect.
-        """
-        self._mock.reset_mock(return_value=return_value, side_effect=side_effect)
-
-    # =========================================================================
-    # Properties
-    # =========================================================================
-
-    @property
-    def return_value(self) -> R:
-        """Value to return when the Mock is called.
-
-        Type checkers recognize the original method's return type R.
-        """
-        return cast("R", self._mock.return_value)
-
-    @return_value.setter
-    def return_value(self, value: R) -> None:
-        """Sets the value to return when the Mock is called.
-
-        Type checkers validate against the original method's return type R.
-
-        Args:
-            value: The return value to set (type R).
-        """
-        self._mock.return_value = value
-
-    @property
-    def side_effect(self) -> Callable[P, R] | BaseException | list[Any] | None:
-        """Side effect to raise when the Mock is called.
-
-        - Callable: Function to execute when called (original signature P -> R).
-        - Exception: Exception to raise when called.
-        - list: List of values to return sequentially.
-        - None: No side effect (use return_value).
-        """
-        return self._mock.side_effect  # type: ignore[no-any-return]
-
-    @side_effect.setter
-    def side_effect(
-        self, value: Callable[P, R] | BaseException | list[Any] | None
-    ) -> None:
-        """Sets the side effect to raise when the Mock is called.
-
-        Args:
-            value: The side effect (function, exception, list of values, or None).
-        """
-        self._mock.side_effect = value
-
-    @property
-    def call_count(self) -> int:
-        """Number of times the Mock was called."""
-        return cast("int", self._mock.call_count)
-
-    @property
-    def called(self) -> bool:
-        """Whether the Mock was called at least once."""
-        return cast("bool", self._mock.called)
-
-    @property
-    def call_args(self) -> Any:
-        """Arguments of the last call. None if never called."""
-        return cast("Any", self._mock.call_args)
-
-    @property
-    def call_args_list(self) -> list[Any]:
-        """List of arguments for all calls."""
-        result: list[Any] = list(self._mock.call_args_list)
-        return result
-
-    # =========================================================================
-    # Attribute access delegation
-    # =========================================================================
-
-    def __getattr__(self, name: str) -> Any:
-        """Delegates undefined attributes to the internal Mock.
-
-        Args:
-            name: Attribute name.
-
-        Returns:
-            The corresponding attribute from the internal Mock.
-        """
-        return getattr(self._mock, name)
-
-    def __setattr__(self, name: str, value: Any) -> None:
-        """Delegates attribute setting to the internal Mock or this instance.
-
-        Args:
-            name: Attribute name.
-            value: Value to set.
-        """
-        if name == "_mock":
-            object.__setattr__(self, name, value)
-        else:
-            setattr(self._mock, name, value)
+        return self._call(*args, **kwargs)  # type: ignore[no-any-return]
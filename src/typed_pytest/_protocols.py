@@ -6,6 +6,7 @@ unittest.mock.MagicMock이 이 Protocol을 만족하도록 설계되었습니다
 """
 
 from typing import Any, Protocol, runtime_checkable
+from unittest.mock import AsyncMock, NonCallableMock
 
 
 @runtime_checkable
@@ -20,6 +21,10 @@ class MockProtocol(Protocol):
         >>> mock = MagicMock()
         >>> isinstance(mock, MockProtocol)
         True
+
+    Note:
+        isinstance() 검사는 모든 멤버를 hasattr로 확인합니다.
+        unittest.mock 객체인지만 알면 되는 경우 is_mock()이 더 빠릅니다.
     """
 
     # =========================================================================
@@ -120,25 +125,14 @@ class MockProtocol(Protocol):
     # Properties
     # =========================================================================
 
-    @property
-    def return_value(self) -> Any:
-        """Mock 호출 시 반환할 값."""
-        ...
-
-    @return_value.setter
-    def return_value(self, value: Any) -> None:
-        """Mock 호출 시 반환할 값 설정."""
-        ...
+    # 읽기/쓰기 속성은 어노테이션으로 선언 (property 디스크립터 불필요).
+    # 읽기 전용 속성은 쓰기 가능으로 오인되지 않도록 @property로 유지.
 
-    @property
-    def side_effect(self) -> Any:
-        """Mock 호출 시 발생시킬 부수 효과 (예외 또는 콜백)."""
-        ...
+    return_value: Any
+    """Mock 호출 시 반환할 값."""
 
-    @side_effect.setter
-    def side_effect(self, value: Any) -> None:
-        """Mock 호출 시 발생시킬 부수 효과 설정."""
-        ...
+    side_effect: Any
+    """Mock 호출 시 발생시킬 부수 효과 (예외 또는 콜백)."""
 
     @property
     def call_count(self) -> int:
@@ -274,3 +268,53 @@ class AsyncMockProtocol(MockProtocol, Protocol):
     def await_args_list(self) -> list[Any]:
         """모든 await의 인자 목록."""
         ...
+
+
+def is_mock(obj: object) -> bool:
+    """객체가 unittest.mock의 Mock 인스턴스인지 확인.
+
+    MockProtocol에 대한 isinstance()와 달리 멤버를 하나씩 확인하지 않고
+    클래스 계층만 검사합니다. MagicMock, AsyncMock, TypedMock 모두 True입니다.
+
+    Args:
+        obj: 확인할 객체.
+
+    Returns:
+        Mock 인스턴스이면 True.
+
+    Example:
+        >>> from unittest.mock import MagicMock
+        >>> is_mock(MagicMock())
+        True
+        >>> is_mock(object())
+        False
+    """
+    return isinstance(obj, NonCallableMock)
+
+
+def is_mock_protocol(obj: object) -> bool:
+    """isinstance(obj, MockProtocol)와 같지만 Mock 인스턴스는 바로 판정.
+
+    unittest.mock 객체는 클래스 계층만으로 MockProtocol을 만족하므로
+    멤버별 hasattr 검사를 건너뜁니다. 그 외 객체(MockedMethod 등)는
+    기존 구조적 검사로 확인합니다.
+
+    Args:
+        obj: 확인할 객체.
+
+    Returns:
+        MockProtocol을 만족하면 True.
+    """
+    return isinstance(obj, (NonCallableMock, MockProtocol))
+
+
+def is_async_mock_protocol(obj: object) -> bool:
+    """isinstance(obj, AsyncMockProtocol)와 같지만 AsyncMock은 바로 판정.
+
+    Args:
+        obj: 확인할 객체.
+
+    Returns:
+        AsyncMockProtocol을 만족하면 True.
+    """
+    return isinstance(obj, (AsyncMock, AsyncMockProtocol))
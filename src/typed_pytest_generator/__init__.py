@@ -2,13 +2,18 @@
 
 __version__ = "0.1.1"
 
-from typed_pytest_generator._config import (
-    ConfigLoadError,
-    GeneratorConfig,
-    load_config,
-)
-from typed_pytest_generator._generator import StubGenerator, generate_stubs
-from typed_pytest_generator.cli import main
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from typed_pytest_generator._config import (
+        ConfigLoadError,
+        GeneratorConfig,
+        load_config,
+    )
+    from typed_pytest_generator._generator import StubGenerator, generate_stubs
+    from typed_pytest_generator.cli import main
 
 
 __all__ = [
@@ -19,3 +24,30 @@ __all__ = [
     "load_config",
     "main",
 ]
+
+# Public name -> defining module. Loaded on first access (PEP 562) so that
+# importing the package does not pull in dataclasses, inspect, ast, etc.
+_LAZY_ATTRIBUTES = {
+    "ConfigLoadError": "typed_pytest_generator._config",
+    "GeneratorConfig": "typed_pytest_generator._config",
+    "load_config": "typed_pytest_generator._config",
+    "StubGenerator": "typed_pytest_generator._generator",
+    "generate_stubs": "typed_pytest_generator._generator",
+    "main": "typed_pytest_generator.cli",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Imports a public name from its module on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Lists module globals together with the lazily imported names."""
+    return sorted({*globals(), *__all__})
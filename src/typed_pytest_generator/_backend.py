@@ -8,6 +8,11 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 
 @dataclass
@@ -54,6 +59,25 @@ class StubBackend(ABC):
         """
         ...
 
+    def prewarm(self, module_names: Iterable[str]) -> None:  # noqa: ARG002
+        """Prepare analysis of several modules ahead of extract_class_info().
+
+        Backends with a per-module setup cost can override this to pay it
+        once for all modules. The default does nothing.
+
+        Args:
+            module_names: Modules whose classes will be extracted next
+        """
+        return
+
+    def close(self) -> None:
+        """Release resources held across extractions.
+
+        StubGenerator calls this once generation is finished. The default
+        does nothing.
+        """
+        return
+
     @abstractmethod
     def get_name(self) -> str:
         """Return the name of this backend for logging."""
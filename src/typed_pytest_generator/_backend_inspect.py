@@ -7,33 +7,147 @@ from __future__ import annotations
 
 import inspect
 import re
+import types
+import typing
+from functools import cache
+from typing import TYPE_CHECKING, Any, ForwardRef, get_args, get_origin, get_type_hints
 
 from typed_pytest_generator._backend import ClassInfo, MethodInfo, StubBackend
 
 
-def _sanitize_default_value(match: re.Match[str]) -> str:
-    """Sanitize a single default value."""
-    value = match.group(1)
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-    # Valid literals - keep as is
-    if re.match(r"^-?\d+\.?\d*$", value):  # Numbers
-        return f"= {value}"
-    if re.match(r'^["\'].*["\']$', value):  # Strings
-        return f"= {value}"
-    if value in ("True", "False", "None"):
-        return f"= {value}"
-    if value in ("[]", "{}", "()", "set()"):
-        return f"= {value}"
-    if value == "...":
-        return f"= {value}"
 
-    return "= ..."
+@cache
+def _cached_signature(func: Callable[..., Any]) -> inspect.Signature:
+    return inspect.signature(func)
 
 
-def _sanitize_signature(sig_str: str) -> str:
-    """Sanitize a signature string to replace invalid default values."""
-    sig_str = re.sub(r"<[^>]+>", "...", sig_str)
-    return re.sub(r"= ([^,\)]+)(?=[,\)])", _sanitize_default_value, sig_str)
+def _signature(func: Callable[..., Any]) -> inspect.Signature:
+    """inspect.signature() memoized per callable.
+
+    Inherited methods resolve to the same function object in every subclass,
+    so each one is introspected once per run. Unhashable callables bypass
+    the cache.
+    """
+    try:
+        return _cached_signature(func)
+    except TypeError:
+        return inspect.signature(func)
+
+
+def _resolve_type_hints(func: Callable[..., Any]) -> dict[str, Any]:
+    """get_type_hints(), or {} when the annotations cannot be resolved.
+
+    Resolution fails e.g. for names only imported under TYPE_CHECKING; the
+    caller then falls back to the raw annotations from the signature.
+    """
+    try:
+        return get_type_hints(func)
+    except Exception:  # any failure means "unresolvable"
+        return {}
+
+
+_cached_type_hints = cache(_resolve_type_hints)
+
+
+def _type_hints(func: Callable[..., Any]) -> dict[str, Any]:
+    """Resolved annotations memoized per function, like _signature().
+
+    Bound methods are keyed on their underlying function so that
+    classmethods hit the cache too.
+    """
+    func = getattr(func, "__func__", func)
+    try:
+        return _cached_type_hints(func)
+    except TypeError:
+        return _resolve_type_hints(func)
+
+
+# Defaults that are valid in a stub as written: numbers, quoted strings,
+# True/False/None, empty collections and the ellipsis.
+_VALID_DEFAULT_PATTERN = re.compile(
+    r"-?\d+\.?\d*|[\"'].*[\"']|True|False|None|\[\]|\{\}|\(\)|set\(\)|\.\.\."
+)
+
+
+def _format_default(value: object) -> str:
+    """Render a parameter default as stub source text.
+
+    Keeps the repr() of literals that are valid as written. Everything else
+    (classes, functions, sentinels like PydanticUndefined) becomes "...".
+    """
+    text = repr(value)
+    return text if _VALID_DEFAULT_PATTERN.fullmatch(text) else "..."
+
+
+def _format_annotation(ann: object) -> str:
+    """Render a resolved annotation as stub source text.
+
+    Walks unions and generic aliases with get_origin()/get_args() so that
+    nested arguments are kept, e.g. "dict[str, typing.Any]". Plain classes
+    and type variables use their bare name, string annotations are passed
+    through, and unresolved forward references become "typing.Any".
+    """
+    if isinstance(ann, str):
+        text = ann
+    elif ann is None or ann is type(None):
+        text = "None"
+    elif ann is Any or isinstance(ann, ForwardRef):
+        text = "typing.Any"
+    elif isinstance(ann, type) and not isinstance(ann, types.GenericAlias):
+        text = ann.__name__
+    elif ann is Ellipsis:
+        text = "..."
+    elif isinstance(ann, list):
+        # The parameter list of Callable[[...], R]
+        text = f"[{', '.join(_format_annotation(arg) for arg in ann)}]"
+    else:
+        text = _format_special_form(ann)
+    return text
+
+
+def _format_special_form(ann: object) -> str:
+    """Render a union, Literal, generic alias or other typing construct."""
+    origin = get_origin(ann)
+    args = get_args(ann)
+    if origin is typing.Union or origin is types.UnionType:
+        text = " | ".join(_format_annotation(arg) for arg in args)
+    elif origin is typing.Literal:
+        text = f"typing.Literal[{', '.join(repr(arg) for arg in args)}]"
+    elif origin is not None:
+        text = getattr(origin, "__name__", None) or str(origin)
+        if args:
+            text += f"[{', '.join(_format_annotation(arg) for arg in args)}]"
+    else:
+        text = getattr(ann, "__name__", None) or str(ann).replace("typing.", "")
+    return text
+
+
+_cached_format_annotation = cache(_format_annotation)
+
+
+def _annotation_text(ann: object) -> str:
+    """_format_annotation() memoized per annotation.
+
+    The same annotations (int, str, dict[str, typing.Any], ...) recur across
+    every method of every class. Unhashable annotations bypass the cache.
+    """
+    try:
+        return _cached_format_annotation(ann)
+    except TypeError:
+        return _format_annotation(ann)
+
+
+_POSITIONAL_ONLY = inspect.Parameter.POSITIONAL_ONLY
+_KEYWORD_ONLY = inspect.Parameter.KEYWORD_ONLY
+# Kinds after which keyword-only parameters need no bare "*" marker.
+_STARRED_OR_KEYWORD_ONLY = (inspect.Parameter.VAR_POSITIONAL, _KEYWORD_ONLY)
+_STAR_PREFIXES: dict[object, str] = {
+    inspect.Parameter.VAR_POSITIONAL: "*",
+    inspect.Parameter.VAR_KEYWORD: "**",
+}
 
 
 class InspectBackend(StubBackend):
@@ -49,10 +163,7 @@ class InspectBackend(StubBackend):
         """Extract class info using inspect module."""
         methods: list[MethodInfo] = []
 
-        for name in dir(cls):
-            if name.startswith("_") and not self.include_private:
-                continue
-
+        for name in self._member_names(cls):
             raw_attr = inspect.getattr_static(cls, name)
             is_static = isinstance(raw_attr, staticmethod)
             is_classmethod = isinstance(raw_attr, classmethod)
@@ -69,28 +180,29 @@ class InspectBackend(StubBackend):
                 )
                 continue
 
-            attr = getattr(cls, name)
+            # Plain functions and static/class methods are resolved from the
+            # raw attribute; only other descriptors go through getattr().
+            # Classmethods stay unbound so that their signature keeps "cls".
+            func = raw_attr.__func__ if is_static or is_classmethod else raw_attr
+            if is_static or is_classmethod or isinstance(raw_attr, types.FunctionType):
+                attr = func
+            else:
+                attr = getattr(cls, name)
             if not callable(attr) or isinstance(attr, type):
                 continue
 
-            # Check if async
-            if is_static or is_classmethod:
-                is_async = inspect.iscoroutinefunction(raw_attr.__func__)
+            # Check if async: read the code flags of plain functions directly,
+            # leaving other callables to inspect
+            code = getattr(func, "__code__", None)
+            if code is not None:
+                is_async = bool(code.co_flags & inspect.CO_COROUTINE)
             else:
-                is_async = inspect.iscoroutinefunction(raw_attr)
+                is_async = inspect.iscoroutinefunction(func)
 
             try:
-                sig = inspect.signature(attr)
-                sig_str = _sanitize_signature(str(sig))
-                param_types = self._extract_param_types(sig)
-
-                # Simplify return type to Any
-                if "->" in sig_str:
-                    parts = sig_str.split("->")
-                    signature = f"{parts[0].rstrip()} -> typing.Any"
-                else:
-                    signature = sig_str
-
+                signature, param_types = self._render_signature(
+                    _signature(attr), attr, is_classmethod=is_classmethod
+                )
                 methods.append(
                     MethodInfo(
                         name=name,
@@ -114,23 +226,69 @@ class InspectBackend(StubBackend):
 
         return ClassInfo(name=cls.__name__, full_name=full_name, methods=methods)
 
-    def _extract_param_types(self, sig: inspect.Signature) -> list[str]:
-        """Extract parameter types from signature."""
+    def _member_names(self, cls: type) -> list[str]:
+        """List the attribute names to consider, sorted like dir(cls).
+
+        Reads the namespaces along the MRO directly and drops private names
+        before any attribute lookup. object only contributes dunders, so it
+        is skipped unless private names are wanted.
+        """
+        if self.include_private:
+            return dir(cls)
+        names = {
+            name
+            for base in cls.__mro__
+            if base is not object
+            for name in vars(base)
+            if not name.startswith("_")
+        }
+        return sorted(names)
+
+    def _render_signature(
+        self,
+        sig: inspect.Signature,
+        func: Callable[..., Any],
+        *,
+        is_classmethod: bool = False,
+    ) -> tuple[str, list[str]]:
+        """Build the stub signature and parameter types from a Signature.
+
+        Annotations are resolved with get_type_hints(), so string and
+        forward-reference annotations come back as real types. If that
+        fails, the raw annotations from the signature are used instead.
+        The "/" and "*" markers follow from the parameter kinds, and the
+        return type is always "typing.Any". Classmethods are passed
+        unbound: "cls" stays in the signature but not in the parameter types.
+        """
+        hints = _type_hints(func)
+        parts: list[str] = []
         param_types: list[str] = []
+        prev_kind: object = None
         for i, (name, param) in enumerate(sig.parameters.items()):
-            if i == 0 and name == "self":
-                continue
+            kind = param.kind
+            if prev_kind is _POSITIONAL_ONLY and kind is not _POSITIONAL_ONLY:
+                parts.append("/")
+            if kind is _KEYWORD_ONLY and prev_kind not in _STARRED_OR_KEYWORD_ONLY:
+                parts.append("*")
+            prev_kind = kind
 
+            text = _STAR_PREFIXES.get(kind, "") + name
             if param.annotation is inspect.Parameter.empty:
-                param_types.append("typing.Any")
+                ann_text = "typing.Any"
+                if param.default is not inspect.Parameter.empty:
+                    text += f"={_format_default(param.default)}"
             else:
-                ann = param.annotation
-                if hasattr(ann, "__name__"):
-                    param_types.append(ann.__name__)
-                else:
-                    ann_str = str(ann).replace("typing.", "")
-                    if ann_str.startswith("ForwardRef("):
-                        ann_str = "typing.Any"
-                    param_types.append(ann_str)
-
-        return param_types
+                ann_text = _annotation_text(hints.get(name, param.annotation))
+                text += f": {ann_text}"
+                if param.default is not inspect.Parameter.empty:
+                    text += f" = {_format_default(param.default)}"
+            parts.append(text)
+
+            # The receiver ("self", or the "cls" of a classmethod) is not
+            # part of the mocked call signature
+            if not (i == 0 and (is_classmethod or name == "self")):
+                param_types.append(ann_text)
+
+        if prev_kind is _POSITIONAL_ONLY:
+            parts.append("/")
+        return f"({', '.join(parts)}) -> typing.Any", param_types
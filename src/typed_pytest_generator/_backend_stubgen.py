@@ -7,13 +7,91 @@ type information than runtime introspection.
 from __future__ import annotations
 
 import ast
+import contextlib
+import hashlib
+import os
+import shutil
 import subprocess
+import sys
 import tempfile
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from typed_pytest_generator._backend import ClassInfo, MethodInfo, StubBackend
 
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+@cache
+def _stubgen_identity() -> str:
+    """Identify the stubgen executable on PATH, which decides the output.
+
+    Uses the script's path and mtime: reinstalling or upgrading mypy
+    rewrites it. This avoids importing importlib.metadata or mypy itself.
+    """
+    executable = shutil.which("stubgen")
+    if executable is None:
+        return ""
+    try:
+        return f"{executable}:{Path(executable).stat().st_mtime_ns}"
+    except OSError:
+        return executable
+
+
+def _disk_cache_path(module_name: str) -> Path | None:
+    """Return the on-disk cache file for a module's stub.
+
+    The key covers the module's source file (path, mtime and size), the
+    Python version and the stubgen executable, so any of them changing
+    misses.
+    Returns None when the module has no source file to key on, or when
+    TYPED_PYTEST_GENERATOR_NO_CACHE is set to a non-empty value.
+    """
+    if os.environ.get("TYPED_PYTEST_GENERATOR_NO_CACHE"):
+        return None
+    source = getattr(sys.modules.get(module_name), "__file__", None)
+    if source is None:
+        return None
+    try:
+        stat = Path(source).stat()
+    except OSError:
+        return None
+
+    key = (
+        f"{module_name}:{source}:{stat.st_mtime_ns}:{stat.st_size}:"
+        f"{sys.version_info}:{_stubgen_identity()}"
+    )
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "typed-pytest-generator" / f"{digest}.pyi"
+
+
+def _read_cached_stub(module_name: str) -> str | None:
+    """Read a module's stub from the disk cache, or None on a miss."""
+    path = _disk_cache_path(module_name)
+    if path is None:
+        return None
+    try:
+        return path.read_text()
+    except OSError:
+        return None
+
+
+def _write_cached_stub(module_name: str, pyi_content: str) -> None:
+    """Store a module's stub in the disk cache (best effort, atomic)."""
+    path = _disk_cache_path(module_name)
+    if path is None or not pyi_content:
+        return
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(pyi_content)
+        tmp_path.replace(path)
+
+
 class StubgenBackend(StubBackend):
     """Backend using mypy's stubgen for AST-based analysis.
 
@@ -21,22 +99,68 @@ class StubgenBackend(StubBackend):
     1. Running stubgen on the module containing the class
     2. Parsing the generated .pyi file
     3. Extracting method signatures from the AST
+
+    Generated stubs are kept under $XDG_CACHE_HOME/typed-pytest-generator
+    (default ~/.cache) and reused while the module's source is unchanged.
+    Set TYPED_PYTEST_GENERATOR_NO_CACHE to disable the disk cache.
     """
 
     def __init__(self, include_private: bool = False) -> None:
         self.include_private = include_private
         self._cache: dict[str, str] = {}  # module -> pyi content
+        # module -> top-level classes of its parsed pyi, by name
+        self._classes: dict[str, dict[str, ast.ClassDef]] = {}
+        # Signature, parameter types and return type all render the same
+        # annotation nodes; memoize per node (the nodes live in self._classes).
+        self._unparse = cache(ast.unparse)
+        # Scratch space for stubgen output, created on first use
+        self._scratch: tempfile.TemporaryDirectory[str] | None = None
 
     def get_name(self) -> str:
         return "stubgen"
 
+    def close(self) -> None:
+        """Remove the scratch directory holding stubgen output."""
+        if self._scratch is not None:
+            self._scratch.cleanup()
+            self._scratch = None
+
+    def prewarm(self, module_names: Iterable[str]) -> None:
+        """Run stubgen once for every module that is not cached yet."""
+        pending: list[str] = []
+        for module_name in dict.fromkeys(module_names):
+            if module_name in self._cache:
+                continue
+            cached = _read_cached_stub(module_name)
+            if cached is None:
+                pending.append(module_name)
+            else:
+                self._cache[module_name] = cached
+        if len(pending) < 2:
+            return
+
+        result, stubs = self._run_stubgen(pending)
+        # stubgen skips modules it cannot import, but a hard failure (e.g. a
+        # syntax error) aborts the batch; leave the cache empty so that
+        # extract_class_info() retries per module and reports the error.
+        if result.returncode != 0:
+            return
+
+        for module_name in pending:
+            pyi_content = stubs.get(module_name, "")
+            self._cache[module_name] = pyi_content
+            _write_cached_stub(module_name, pyi_content)
+
     def extract_class_info(self, cls: type, full_name: str) -> ClassInfo:
         """Extract class info using stubgen."""
         module_name = cls.__module__
 
         # Generate stub if not cached
         if module_name not in self._cache:
-            pyi_content = self._generate_stub(module_name)
+            pyi_content = _read_cached_stub(module_name)
+            if pyi_content is None:
+                pyi_content = self._generate_stub(module_name)
+                _write_cached_stub(module_name, pyi_content)
             self._cache[module_name] = pyi_content
 
         pyi_content = self._cache[module_name]
@@ -44,58 +168,105 @@ class StubgenBackend(StubBackend):
             # Fallback: return empty info
             return ClassInfo(name=cls.__name__, full_name=full_name, methods=[])
 
-        # Parse the .pyi content
-        return self._parse_class_from_pyi(cls.__name__, full_name, pyi_content)
+        # Parse and index the .pyi content once per module, then look the class up
+        if module_name not in self._classes:
+            self._classes[module_name] = self._index_pyi(pyi_content)
+        return self._parse_class_from_pyi(cls, full_name, self._classes[module_name])
 
     def _generate_stub(self, module_name: str) -> str:
         """Generate stub using stubgen CLI."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = subprocess.run(
-                ["stubgen", "-m", module_name, "-o", tmpdir],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
-
-            if result.returncode != 0:
-                print(f"[stubgen] Warning: stubgen failed for {module_name}")
-                print(f"[stubgen] stderr: {result.stderr}")
-                return ""
-
-            # Find the generated .pyi file
-            pyi_path = Path(tmpdir) / module_name.replace(".", "/")
-            pyi_path = pyi_path.with_suffix(".pyi")
-
-            # Handle nested modules
-            if not pyi_path.exists():
-                parts = module_name.split(".")
-                pyi_path = Path(tmpdir)
-                for part in parts[:-1]:
-                    pyi_path = pyi_path / part
-                pyi_path = pyi_path / f"{parts[-1]}.pyi"
-
-            if pyi_path.exists():
-                return pyi_path.read_text()
+        result, stubs = self._run_stubgen([module_name])
 
+        if result.returncode != 0:
+            print(f"[stubgen] Warning: stubgen failed for {module_name}")
+            print(f"[stubgen] stderr: {result.stderr}")
             return ""
 
-    def _parse_class_from_pyi(
-        self, class_name: str, full_name: str, pyi_content: str
-    ) -> ClassInfo:
-        """Parse a class from .pyi content."""
+        return stubs.get(module_name, "")
+
+    def _run_stubgen(
+        self, module_names: list[str]
+    ) -> tuple[subprocess.CompletedProcess[str], dict[str, str]]:
+        """Run stubgen once for the given modules.
+
+        Each run writes to its own directory under the backend's scratch
+        directory, which is created once and removed by close().
+
+        Returns:
+            The finished process and the generated stubs by module name
+            (empty if stubgen failed)
+        """
+        if self._scratch is None:
+            self._scratch = tempfile.TemporaryDirectory(prefix="typed-pytest-stubgen-")
+        output_dir = Path(tempfile.mkdtemp(dir=self._scratch.name))
+
+        args = ["stubgen"]
+        for module_name in module_names:
+            args.extend(["-m", module_name])
+        args.extend(["-o", str(output_dir)])
+
+        result = subprocess.run(args, check=False, capture_output=True, text=True)
+        if result.returncode != 0:
+            return result, {}
+        return result, self._collect_stubs(output_dir)
+
+    def _collect_stubs(self, root: Path) -> dict[str, str]:
+        """Read every .pyi stubgen wrote under root, keyed by module name.
+
+        Packages are written as "pkg/__init__.pyi" and map to "pkg".
+        """
+        stubs: dict[str, str] = {}
+        for pyi_path in root.rglob("*.pyi"):
+            parts = pyi_path.relative_to(root).with_suffix("").parts
+            if parts[-1] == "__init__":
+                parts = parts[:-1]
+            stubs[".".join(parts)] = pyi_path.read_text()
+        return stubs
+
+    def _index_pyi(self, pyi_content: str) -> dict[str, ast.ClassDef]:
+        """Parse .pyi content and index its top-level classes by name.
+
+        Returns an empty index if the content is not valid Python.
+        """
         try:
             tree = ast.parse(pyi_content)
         except SyntaxError:
-            return ClassInfo(name=class_name, full_name=full_name, methods=[])
+            return {}
 
+        classes: dict[str, ast.ClassDef] = {}
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                classes.setdefault(node.name, node)
+        return classes
+
+    def _parse_class_from_pyi(
+        self, cls: type, full_name: str, classes: dict[str, ast.ClassDef]
+    ) -> ClassInfo:
+        """Find a class in an indexed .pyi module and extract its methods.
+
+        The top-level class comes from the index; nested classes are found
+        by following the qualified name through class bodies only.
+        """
         methods: list[MethodInfo] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == class_name:
-                methods = self._extract_methods_from_class(node)
+        outer_name, *inner_names = cls.__qualname__.split(".")
+        class_node = classes.get(outer_name)
+        for part in inner_names:
+            if class_node is None:
                 break
+            class_node = next(
+                (
+                    node
+                    for node in class_node.body
+                    if isinstance(node, ast.ClassDef) and node.name == part
+                ),
+                None,
+            )
+
+        if class_node is not None:
+            methods = self._extract_methods_from_class(class_node)
 
-        return ClassInfo(name=class_name, full_name=full_name, methods=methods)
+        return ClassInfo(name=cls.__name__, full_name=full_name, methods=methods)
 
     def _extract_methods_from_class(self, class_node: ast.ClassDef) -> list[MethodInfo]:
         """Extract methods from a class AST node."""
@@ -158,13 +329,13 @@ class StubgenBackend(StubBackend):
         for i, arg in enumerate(args.args):
             arg_str = arg.arg
             if arg.annotation:
-                arg_str += f": {ast.unparse(arg.annotation)}"
+                arg_str += f": {self._unparse(arg.annotation)}"
 
             # Check for default value
             default_idx = i - (len(args.args) - len(args.defaults))
             if default_idx >= 0 and default_idx < len(args.defaults):
                 default = args.defaults[default_idx]
-                arg_str += f" = {ast.unparse(default)}"
+                arg_str += f" = {self._unparse(default)}"
 
             parts.append(arg_str)
 
@@ -172,7 +343,7 @@ class StubgenBackend(StubBackend):
         if args.vararg:
             vararg_str = f"*{args.vararg.arg}"
             if args.vararg.annotation:
-                vararg_str += f": {ast.unparse(args.vararg.annotation)}"
+                vararg_str += f": {self._unparse(args.vararg.annotation)}"
             parts.append(vararg_str)
         elif args.kwonlyargs:
             parts.append("*")
@@ -181,18 +352,18 @@ class StubgenBackend(StubBackend):
         for i, arg in enumerate(args.kwonlyargs):
             arg_str = arg.arg
             if arg.annotation:
-                arg_str += f": {ast.unparse(arg.annotation)}"
+                arg_str += f": {self._unparse(arg.annotation)}"
             if i < len(args.kw_defaults):
                 kw_default = args.kw_defaults[i]
                 if kw_default is not None:
-                    arg_str += f" = {ast.unparse(kw_default)}"
+                    arg_str += f" = {self._unparse(kw_default)}"
             parts.append(arg_str)
 
         # **kwargs
         if args.kwarg:
             kwarg_str = f"**{args.kwarg.arg}"
             if args.kwarg.annotation:
-                kwarg_str += f": {ast.unparse(args.kwarg.annotation)}"
+                kwarg_str += f": {self._unparse(args.kwarg.annotation)}"
             parts.append(kwarg_str)
 
         params = ", ".join(parts)
@@ -211,7 +382,7 @@ class StubgenBackend(StubBackend):
                 continue
 
             if arg.annotation:
-                param_types.append(ast.unparse(arg.annotation))
+                param_types.append(self._unparse(arg.annotation))
             else:
                 param_types.append("typing.Any")
 
@@ -220,5 +391,5 @@ class StubgenBackend(StubBackend):
     def _get_return_type(self, func: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
         """Get return type from function AST."""
         if func.returns:
-            return ast.unparse(func.returns)
+            return self._unparse(func.returns)
         return "typing.Any"
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Literal
 
 
@@ -82,9 +83,9 @@ class GeneratorConfig:
             cli_include_private if cli_include_private else self.include_private
         )
 
-        # Exclude targets are merged (union of both)
+        # Exclude targets are merged (union of both, config entries first)
         exclude_targets = list(
-            set(self.exclude_targets) | set(cli_exclude_targets or [])
+            dict.fromkeys([*self.exclude_targets, *(cli_exclude_targets or [])])
         )
 
         # CLI backend overrides config if provided
@@ -132,6 +133,16 @@ def find_pyproject_toml(start_path: Path | None = None) -> Path | None:
     return None
 
 
+@lru_cache(maxsize=8)
+def _read_toml(path: str, mtime_ns: int, size: int) -> dict[str, Any]:  # noqa: ARG001
+    """Parse a TOML file, memoized on its path, mtime and size.
+
+    The stat fields are only part of the cache key, so editing the file
+    invalidates the cached result.
+    """
+    return tomllib.loads(Path(path).read_bytes().decode())
+
+
 def load_config_from_toml(toml_path: Path) -> GeneratorConfig:
     """Load configuration from a pyproject.toml file.
 
@@ -145,8 +156,8 @@ def load_config_from_toml(toml_path: Path) -> GeneratorConfig:
         ConfigLoadError: If file cannot be read or parsed
     """
     try:
-        with toml_path.open("rb") as f:
-            data = tomllib.load(f)
+        stat = toml_path.stat()
+        data = _read_toml(str(toml_path.resolve()), stat.st_mtime_ns, stat.st_size)
     except FileNotFoundError as e:
         raise ConfigLoadError(f"Config file not found: {toml_path}") from e
     except tomllib.TOMLDecodeError as e:
@@ -198,11 +209,12 @@ def _parse_config_dict(data: dict[str, Any]) -> GeneratorConfig:
     if backend not in ("inspect", "stubgen"):
         raise ConfigLoadError("'backend' must be 'inspect' or 'stubgen'")
 
+    # Copy the lists: the parsed data is shared through _read_toml's cache
     return GeneratorConfig(
-        targets=targets,
+        targets=list(targets),
         output_dir=output_dir,
         include_private=include_private,
-        exclude_targets=exclude_targets,
+        exclude_targets=list(exclude_targets),
         backend=backend,  # type: ignore[arg-type]
     )
 
@@ -2,74 +2,20 @@
 
 from __future__ import annotations
 
-import inspect
 import pkgutil
-import re
 import sys
 from importlib import import_module
 from pathlib import Path
 from typing import Literal, TypeVar
 
-from typed_pytest_generator._backend import StubBackend
+from typed_pytest_generator._backend import ClassInfo, StubBackend
 from typed_pytest_generator._backend_inspect import InspectBackend
-from typed_pytest_generator._inspector import inspect_class
-from typed_pytest_generator._templates import generate_class_stub
 
 
 T = TypeVar("T")
 BackendType = Literal["inspect", "stubgen"]
 
 
-def _sanitize_default_value(match: re.Match[str]) -> str:
-    """Sanitize a single default value.
-
-    Args:
-        match: Regex match containing the default value
-
-    Returns:
-        Sanitized default value or original if valid
-    """
-    value = match.group(1)
-
-    # Valid literals - keep as is
-    if re.match(r"^-?\d+\.?\d*$", value):  # Numbers (int, float, negative)
-        return f"= {value}"
-    # Strings (single or double quoted)
-    if re.match(r'^["\'].*["\']$', value):
-        return f"= {value}"
-    # Booleans and None
-    if value in ("True", "False", "None"):
-        return f"= {value}"
-    # Empty collections
-    if value in ("[]", "{}", "()", "set()"):
-        return f"= {value}"
-    # Ellipsis
-    if value == "...":
-        return f"= {value}"
-
-    # Everything else (undefined identifiers, <class ...>, etc.) -> ...
-    return "= ..."
-
-
-def _sanitize_signature(sig_str: str) -> str:
-    """Sanitize a signature string to replace invalid default values.
-
-    Replaces invalid default values (like `<class 'Foo'>`, `PydanticUndefined`,
-    or other undefined identifiers) with `...`.
-
-    Args:
-        sig_str: The signature string to sanitize
-
-    Returns:
-        A sanitized signature string with valid Python syntax
-    """
-    # First replace <class ...> and <function ...> patterns
-    sig_str = re.sub(r"<[^>]+>", "...", sig_str)
-
-    # Then sanitize all default values (match: = <value> followed by , or ))
-    return re.sub(r"= ([^,\)]+)(?=[,\)])", _sanitize_default_value, sig_str)
-
-
 def _create_backend(backend_type: BackendType, include_private: bool) -> StubBackend:
     """Create a stub backend instance.
 
@@ -89,6 +35,23 @@ def _create_backend(backend_type: BackendType, include_private: bool) -> StubBac
     return InspectBackend(include_private=include_private)
 
 
+def _write_if_changed(path: Path, content: str) -> None:
+    """Write content to path unless the file already holds exactly that.
+
+    Unchanged outputs keep their mtime, so re-running the generator does not
+    invalidate caches or watchers keyed on the stub package. Changed outputs
+    are written to a sibling temporary file and renamed into place.
+    """
+    try:
+        if path.read_text() == content:
+            return
+    except OSError:
+        pass
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(content)
+    tmp_path.replace(path)
+
+
 class StubGenerator:
     """Generates .pyi stub files for TypedMock with method signatures."""
 
@@ -132,8 +95,8 @@ class StubGenerator:
         expanded_targets = self._expand_targets(self.targets)
 
         generated_files: list[Path] = []
-        stubs: dict[str, str] = {}
-        class_to_target: dict[str, str] = {}  # Map class name to full target path
+        classes: dict[str, tuple[type, str]] = {}  # Class name -> (class, target)
+        class_modules: dict[str, None] = {}  # Ordered set of defining modules
 
         for target in expanded_targets:
             cls = self._import_class(target)
@@ -144,36 +107,36 @@ class StubGenerator:
                 )
                 continue
 
-            stub_content = self._generate_stub(cls, target)
-            if stub_content:
-                class_name = cls.__name__
-                stubs[class_name] = stub_content
-                class_to_target[class_name] = target
+            classes[cls.__name__] = (cls, target)
+            class_modules[cls.__module__] = None
+
+        # Walk each class once; __init__.py and _runtime.py share the result
+        class_infos: list[ClassInfo] = []
+        try:
+            self.backend.prewarm(class_modules)
+            for cls, target in classes.values():
+                info = self._extract_class_info(cls, target)
+                if info is not None:
+                    class_infos.append(info)
+        finally:
+            self.backend.close()
 
         # Generate __init__.py for the stub package
-        if stubs:
+        if class_infos:
+            names = [info.name for info in class_infos]
             # Generate __init__.py for the stub package
             # This file allows importing from the stub package at runtime
             # while .pyi files provide type information
 
-            # Generate import lines with commas
-            import_parts: list[str] = []
-            for name in stubs:
-                import_parts.extend(
-                    [f"    {name}", f"    {name}_TypedMock", f"    {name}Mock"]
-                )
-            # Add typed_mock function
-            import_parts.append("    typed_mock")
-            import_lines = [",\n".join(import_parts)]
-
-            # Generate __all__ entries
-            all_parts: list[str] = []
-            for name in stubs:
-                all_parts.extend(
-                    [f'    "{name}"', f'    "{name}_TypedMock"', f'    "{name}Mock"']
-                )
-            all_parts.append('    "typed_mock"')
-            all_lines = [",\n".join(all_parts)]
+            # One line per exported name, formatted as a block per class
+            import_block = "".join(
+                f"    {name},\n    {name}_TypedMock,\n    {name}Mock,\n"
+                for name in names
+            )
+            all_block = "".join(
+                f'    "{name}",\n    "{name}_TypedMock",\n    "{name}Mock",\n'
+                for name in names
+            )
 
             init_py_lines: list[str] = [
                 '"""Type stub package for typed-pytest.',
@@ -193,42 +156,38 @@ class StubGenerator:
                 "# Re-export all stub classes from _runtime for runtime compatibility",
                 "from ._runtime import (",
             ]
-            init_py_lines.extend(import_lines)
             init_py_lines.extend(
                 [
+                    f"{import_block}    typed_mock",
                     ")",
                     "",
                     "__all__ = [",
+                    f'{all_block}    "typed_mock"',
+                    "]",
+                    "",
                 ]
             )
-            init_py_lines.extend(all_lines)
-            init_py_lines.extend(["]", ""])
 
             init_py_content = "\n".join(init_py_lines)
             init_py_path = self.output_dir / "__init__.py"
-            init_py_path.write_text(init_py_content)
+            _write_if_changed(init_py_path, init_py_content)
             generated_files.append(init_py_path)
 
             # Generate _runtime.py with method signatures from backend
-            runtime_classes: list[str] = []
-            for target in class_to_target.values():
-                cls = self._import_class(target)
-                if cls is None:
-                    continue
-
-                runtime_class_str = self._generate_runtime_class(cls, target)
-                runtime_classes.append(runtime_class_str)
+            runtime_classes = [
+                self._generate_runtime_class(info) for info in class_infos
+            ]
 
             # Generate overloaded typed_mock function
             typed_mock_overloads: list[str] = []
-            for class_name in stubs:
+            for class_name in names:
                 typed_mock_overloads.append("@typing.overload")
                 typed_mock_overloads.append(
                     f"def typed_mock(cls: type[{class_name}], *, "
                     f"spec_set: bool = ..., strict: bool = ...) -> {class_name}_TypedMock: ..."
                 )
 
-            # Add the actual implementation
+            # Add the actual implementation (delegates to typed_pytest.typed_mock)
             typed_mock_impl = [
                 "",
                 "def typed_mock(cls: type, *, spec_set: bool = False, strict: bool = False):",
@@ -242,10 +201,7 @@ class StubGenerator:
                 "    Returns:",
                 "        A TypedMock instance with proper type hints for IDE auto-completion",
                 '    """',
-                "    from typed_pytest import TypedMock",
-                "    if spec_set or strict:",
-                "        return TypedMock(spec_set=cls)",
-                "    return TypedMock(spec=cls)",
+                "    return _typed_mock(cls, spec_set=spec_set or strict)",
             ]
 
             runtime_py_content = "\n\n".join(
@@ -260,6 +216,7 @@ class StubGenerator:
                     "import typing",
                     "",
                     "from typed_pytest import AsyncMockedMethod, MockedMethod",
+                    "from typed_pytest import typed_mock as _typed_mock",
                     "",
                 ]
                 + runtime_classes
@@ -268,7 +225,7 @@ class StubGenerator:
                 + [""]
             )
             runtime_py_path = self.output_dir / "_runtime.py"
-            runtime_py_path.write_text(runtime_py_content)
+            _write_if_changed(runtime_py_path, runtime_py_content)
             generated_files.append(runtime_py_path)
 
         return generated_files
@@ -396,18 +353,35 @@ class StubGenerator:
             )
             return None
 
-    def _generate_runtime_class(self, cls: type, target: str) -> str:
-        """Generate runtime class string using backend.
+    def _extract_class_info(self, cls: type, target: str) -> ClassInfo | None:
+        """Extract method information for a class using the backend.
 
         Args:
-            cls: The class to generate runtime code for
+            cls: The class to extract
             target: Fully qualified class name
 
+        Returns:
+            ClassInfo for the class, or None if extraction failed
+        """
+        try:
+            return self.backend.extract_class_info(cls, target)
+        except Exception as e:
+            print(
+                f"[typed-pytest-generator] Error generating stub for {target}: {e}",
+                file=sys.stderr,
+            )
+            return None
+
+    def _generate_runtime_class(self, info: ClassInfo) -> str:
+        """Generate runtime class string from extracted class info.
+
+        Args:
+            info: Class information extracted by the backend
+
         Returns:
             String containing class definitions for _runtime.py
         """
-        class_name = cls.__name__
-        info = self.backend.extract_class_info(cls, target)
+        class_name = info.name
 
         # Collect method info for both base class and TypedMock class
         method_lines: list[str] = [f"class {class_name}:"]
@@ -438,13 +412,12 @@ class StubGenerator:
                 )
                 continue
 
-            # Build simplified signature (use return_type from backend)
-            # Extract just the parameters part from signature
-            sig_str = method.signature
-            if "->" in sig_str:
-                params_part = sig_str.split("->")[0].rstrip()
-            else:
-                params_part = sig_str
+            # Build simplified signature (use return_type from backend).
+            # Backends render "(params) -> return_type", so the return arrow
+            # is the last one; "->" inside a default such as sep="->" stays.
+            params_part, arrow, _ = method.signature.rpartition(" -> ")
+            if not arrow:
+                params_part = method.signature
 
             simplified = f"{params_part} -> {method.return_type}: ..."
 
@@ -452,13 +425,10 @@ class StubGenerator:
             async_prefix = "async " if method.is_async else ""
             if method.is_static:
                 method_lines.append("    @staticmethod")
-                method_lines.append(f"    {async_prefix}def {method.name}{simplified}")
             elif method.is_classmethod:
+                # Both backends keep 'cls' in classmethod signatures
                 method_lines.append("    @classmethod")
-                # For classmethod, signature already has 'cls'
-                method_lines.append(f"    {async_prefix}def {method.name}{simplified}")
-            else:
-                method_lines.append(f"    {async_prefix}def {method.name}{simplified}")
+            method_lines.append(f"    {async_prefix}def {method.name}{simplified}")
 
             # Add to TypedMock class as property returning MockedMethod/AsyncMockedMethod
             mocked_method_type = (
@@ -500,77 +470,6 @@ class StubGenerator:
             return "[]"
         return "[" + ", ".join(param_types) + "]"
 
-    def _extract_param_types(self, sig: inspect.Signature) -> str:
-        """Extract parameter types from a signature for MockedMethod.
-
-        Args:
-            sig: The method signature
-
-        Returns:
-            String representation of parameter types, e.g., "[int, str]"
-        """
-        param_types: list[str] = []
-        for i, (name, param) in enumerate(sig.parameters.items()):
-            # Skip 'self' for instance methods (classmethods already have cls bound)
-            if i == 0 and name == "self":
-                continue
-
-            if param.annotation is inspect.Parameter.empty:
-                param_types.append("typing.Any")
-            else:
-                # Convert annotation to string, handling special cases
-                ann = param.annotation
-                if hasattr(ann, "__name__"):
-                    param_types.append(ann.__name__)
-                else:
-                    ann_str = str(ann)
-                    # Clean up typing module prefixes for readability
-                    ann_str = ann_str.replace("typing.", "")
-                    # Handle forward references
-                    if ann_str.startswith("ForwardRef("):
-                        ann_str = "typing.Any"
-                    param_types.append(ann_str)
-
-        if not param_types:
-            return "[]"
-        return "[" + ", ".join(param_types) + "]"
-
-    def _generate_stub(self, cls: type, full_name: str) -> str | None:
-        """Generate .pyi content for a single class.
-
-        Args:
-            cls: The class to generate stub for
-            full_name: Fully qualified name of the class
-
-        Returns:
-            Generated .pyi content, or None if generation failed
-        """
-        try:
-            methods = inspect_class(cls, include_private=self.include_private)
-            return generate_class_stub(cls.__name__, full_name, methods)
-        except Exception as e:
-            print(
-                f"[typed-pytest-generator] Error generating stub for {full_name}: {e}",
-                file=sys.stderr,
-            )
-            return None
-
-    def _get_classes_with_methods(self, stubs: dict[str, str]) -> dict[str, type]:
-        """Get actual classes with their methods for runtime generation.
-
-        Args:
-            stubs: Dictionary mapping stub names to their content
-
-        Returns:
-            Dictionary mapping targets to their actual class objects
-        """
-        result: dict[str, type] = {}
-        for target in stubs:
-            cls = self._import_class(target)
-            if cls is not None:
-                result[target] = cls
-        return result
-
 
 def generate_stubs(
     targets: list[str],
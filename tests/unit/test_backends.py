@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 from tests.fixtures.sample_classes import (
@@ -12,6 +14,14 @@ from typed_pytest_generator._backend import ClassInfo, MethodInfo, StubBackend
 from typed_pytest_generator._backend_inspect import InspectBackend
 
 
+@pytest.fixture(autouse=True)
+def isolated_stub_cache(monkeypatch, tmp_path):
+    """Point the stubgen disk cache at a fresh directory for each test."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home / "typed-pytest-generator"
+
+
 class TestMethodInfo:
     """Tests for MethodInfo dataclass."""
 
@@ -121,6 +131,32 @@ class TestInspectBackend:
         assert "async_create_user" in method_map
         assert method_map["async_create_user"].is_async is True
 
+    def test_detects_async_static_and_class_methods(self) -> None:
+        """Test that async detection looks through staticmethod/classmethod."""
+
+        class Handler:
+            def __call__(self) -> None: ...
+
+        class Service:
+            handle = Handler()
+
+            @staticmethod
+            async def fetch() -> None: ...
+
+            @classmethod
+            async def build(cls) -> None: ...
+
+            @classmethod
+            def create(cls) -> None: ...
+
+        info = InspectBackend().extract_class_info(Service, "tests.Service")
+        method_map = {m.name: m for m in info.methods}
+
+        assert method_map["fetch"].is_async is True
+        assert method_map["build"].is_async is True
+        assert method_map["create"].is_async is False
+        assert method_map["handle"].is_async is False
+
     def test_detects_properties(self) -> None:
         """Test that properties are detected."""
         backend = InspectBackend()
@@ -159,6 +195,9 @@ class TestInspectBackend:
 
         assert "from_config" in method_map
         assert method_map["from_config"].is_classmethod is True
+        # cls stays in the signature but is not a mocked parameter
+        assert method_map["from_config"].signature.startswith("(cls, config")
+        assert method_map["from_config"].param_types == ["dict[str, typing.Any]"]
 
     def test_excludes_private_by_default(self) -> None:
         """Test that private methods are excluded by default."""
@@ -194,6 +233,154 @@ class TestInspectBackend:
         assert "find_by_id" in method_map
         assert "int" in method_map["find_by_id"].param_types
 
+    def test_param_types_keep_generic_arguments(self) -> None:
+        """Test that param types are rendered from resolved annotations."""
+        from collections.abc import Callable
+        from typing import Any, Literal, Optional
+
+        def run(self, config, limit, name, hooks, *, mode) -> None: ...
+
+        # Real objects rather than strings, as without postponed evaluation
+        run.__annotations__ = {
+            "config": dict[str, Any],
+            "limit": Optional[int],  # noqa: UP045
+            "name": "str",
+            "hooks": list[Callable[[int], str]],
+            "mode": Literal["fast"],
+        }
+        service = type("Service", (), {"run": run})
+
+        info = InspectBackend().extract_class_info(service, "tests.Service")
+
+        assert info.methods[0].param_types == [
+            "dict[str, typing.Any]",
+            "int | None",
+            "str",
+            "list[Callable[[int], str]]",
+            "typing.Literal['fast']",
+        ]
+
+    def test_unresolvable_annotations_fall_back_to_source(self) -> None:
+        """Test that annotations naming unknown types are kept as written."""
+
+        class Service:
+            def run(self, repo: MissingRepository, user_id: int) -> None: ...  # noqa: F821
+
+        info = InspectBackend().extract_class_info(Service, "tests.Service")
+
+        assert info.methods[0].param_types == ["MissingRepository", "int"]
+
+    def test_annotation_text_is_cached(self) -> None:
+        """Repeated annotations are formatted once; unhashable ones still work."""
+        from typed_pytest_generator._backend_inspect import (
+            _annotation_text,
+            _cached_format_annotation,
+        )
+
+        _annotation_text(dict[str, int])
+        hits = _cached_format_annotation.cache_info().hits
+
+        assert _annotation_text(dict[str, int]) == "dict[str, int]"
+        assert _cached_format_annotation.cache_info().hits == hits + 1
+        assert _annotation_text([int, str]) == "[int, str]"
+
+    def test_builds_signature_from_parameter_kinds(self) -> None:
+        """Test that markers, stars and defaults follow the parameter kinds."""
+
+        class Service:
+            def run(self, a, /, b: int = 1, *args, c, d=None, **kw: str): ...
+
+            def find(self, *, limit: int = -1, key=str) -> int: ...
+
+            def only(self, value, /): ...
+
+        info = InspectBackend().extract_class_info(Service, "tests.Service")
+        signatures = {m.name: m.signature for m in info.methods}
+
+        assert signatures == {
+            "run": "(self, a, /, b: int = 1, *args, c, d=None, **kw: str)"
+            " -> typing.Any",
+            "find": "(self, *, limit: int = -1, key=...) -> typing.Any",
+            "only": "(self, value, /) -> typing.Any",
+        }
+
+    def test_inherited_methods_share_cached_signature(self) -> None:
+        """Inherited methods are introspected once across subclasses."""
+        from typed_pytest_generator._backend_inspect import _cached_signature
+
+        class Base:
+            def run(self, value: int) -> None: ...
+
+        class Left(Base): ...
+
+        class Right(Base): ...
+
+        backend = InspectBackend()
+        backend.extract_class_info(Left, "tests.Left")
+        hits = _cached_signature.cache_info().hits
+        backend.extract_class_info(Right, "tests.Right")
+
+        assert _cached_signature.cache_info().hits > hits
+
+    def test_member_names_match_public_dir(self) -> None:
+        """Public names come from the MRO in dir() order, without object's."""
+
+        class Base(dict[str, int]):
+            def run(self) -> None: ...
+
+        class Child(Base):
+            def _hidden(self) -> None: ...
+
+            def stop(self) -> None: ...
+
+        info = InspectBackend().extract_class_info(Child, "tests.Child")
+        names = [m.name for m in info.methods]
+
+        assert names == [n for n in dir(Child) if not n.startswith("_")]
+        assert {"keys", "run", "stop"} <= set(names)
+
+    def test_methods_resolved_without_class_attribute_lookup(self) -> None:
+        """Functions and static/class methods bypass the metaclass lookup."""
+
+        class Meta(type):
+            def __getattribute__(cls, name: str) -> object:
+                if name in {"run", "check", "build"}:
+                    raise RuntimeError(name)
+                return super().__getattribute__(name)
+
+        class Service(metaclass=Meta):
+            def run(self, value: int) -> None: ...
+
+            @staticmethod
+            def check(value: str) -> bool: ...
+
+            @classmethod
+            def build(cls, name: str) -> None: ...
+
+        info = InspectBackend().extract_class_info(Service, "tests.Service")
+        signatures = {m.name: m.signature for m in info.methods}
+
+        assert signatures == {
+            "build": "(cls, name: str) -> typing.Any",
+            "check": "(value: str) -> typing.Any",
+            "run": "(self, value: int) -> typing.Any",
+        }
+
+    def test_unhashable_callable_attribute(self) -> None:
+        """Unhashable callables are still introspected."""
+
+        class Handler:
+            __hash__ = None  # type: ignore[assignment]
+
+            def __call__(self, value: int) -> None: ...
+
+        class Service:
+            handle = Handler()
+
+        info = InspectBackend().extract_class_info(Service, "tests.Service")
+
+        assert [m.name for m in info.methods] == ["handle"]
+
     def test_is_stub_backend(self) -> None:
         """Test that InspectBackend is a StubBackend."""
         backend = InspectBackend()
@@ -238,6 +425,153 @@ class TestStubgenBackendConditional:
             # Could be "User | None" or similar
             assert return_type != "" or return_type == "typing.Any"
 
+    def test_prewarm_runs_stubgen_once(self, stubgen_backend, mocker) -> None:
+        """Test that prewarm() analyses all modules in one stubgen run."""
+        import subprocess
+
+        from tests.fixtures.sample_package import PackageLevelClass
+        from tests.fixtures.sample_package.module_a import ClassA
+        from tests.fixtures.sample_package.module_b import ClassB
+
+        classes = [PackageLevelClass, ClassA, ClassB]
+        run = mocker.spy(subprocess, "run")
+        stubgen_backend.prewarm([cls.__module__ for cls in classes])
+        infos = [stubgen_backend.extract_class_info(cls, "x") for cls in classes]
+
+        assert run.call_count == 1
+        assert all(info.methods for info in infos)
+
+    def test_runs_share_scratch_dir_until_close(self, stubgen_backend, mocker) -> None:
+        """Test that stubgen runs reuse one scratch directory, removed by close()."""
+        import subprocess
+
+        from tests.fixtures.sample_package.module_a import ClassA
+
+        run = mocker.spy(subprocess, "run")
+        stubgen_backend.extract_class_info(ClassA, "ClassA")
+        stubgen_backend.extract_class_info(
+            UserRepository, "tests.fixtures.sample_classes.UserRepository"
+        )
+        output_dirs = [Path(call.args[0][-1]) for call in run.call_args_list]
+
+        assert len(output_dirs) == 2
+        assert output_dirs[0].parent == output_dirs[1].parent
+        stubgen_backend.close()
+        assert not output_dirs[0].parent.exists()
+
+    def test_extracts_package_level_class(self, stubgen_backend) -> None:
+        """Test that classes defined in a package __init__ are found."""
+        from tests.fixtures.sample_package import PackageLevelClass
+
+        info = stubgen_backend.extract_class_info(
+            PackageLevelClass, "tests.fixtures.sample_package.PackageLevelClass"
+        )
+
+        assert [m.name for m in info.methods] == ["package_method"]
+
+    def test_prewarm_skips_unimportable_modules(self, stubgen_backend, mocker) -> None:
+        """Test that one unimportable module does not spoil the batch."""
+        import subprocess
+
+        run = mocker.spy(subprocess, "run")
+        stubgen_backend.prewarm(
+            ["tests.fixtures.sample_classes", "tests.fixtures.does_not_exist"]
+        )
+        info = stubgen_backend.extract_class_info(
+            UserRepository, "tests.fixtures.sample_classes.UserRepository"
+        )
+
+        assert run.call_count == 1
+        assert "find_by_id" in [m.name for m in info.methods]
+
+    def test_builds_signature_from_stub(self, stubgen_backend) -> None:
+        """Test signature, parameter and return types rendered from the .pyi."""
+        info = stubgen_backend.extract_class_info(
+            UserService, "tests.fixtures.sample_classes.UserService"
+        )
+        method = {m.name: m for m in info.methods}["update_user"]
+
+        assert method.signature == (
+            "(self, user_id: int, *, name: str | None = None, "
+            "email: str | None = None) -> dict[str, Any]"
+        )
+        assert method.param_types == ["int"]
+        assert method.return_type == "dict[str, Any]"
+
+    def test_parses_module_stub_once(self, stubgen_backend, mocker) -> None:
+        """Test that classes from one module share a single parsed .pyi."""
+        import ast
+
+        stubgen_backend.extract_class_info(
+            UserRepository, "tests.fixtures.sample_classes.UserRepository"
+        )
+        parse = mocker.spy(ast, "parse")
+        info = stubgen_backend.extract_class_info(
+            UserService, "tests.fixtures.sample_classes.UserService"
+        )
+
+        assert parse.call_count == 0
+        assert "get_user" in [m.name for m in info.methods]
+
+    def test_reuses_disk_cache_across_instances(
+        self, isolated_stub_cache, mocker
+    ) -> None:
+        """Test that a fresh backend reads stubs from the disk cache."""
+        import subprocess
+
+        from typed_pytest_generator._backend_stubgen import StubgenBackend
+
+        target = "tests.fixtures.sample_classes.UserRepository"
+        first = StubgenBackend().extract_class_info(UserRepository, target)
+        run = mocker.spy(subprocess, "run")
+        second = StubgenBackend().extract_class_info(UserRepository, target)
+
+        assert run.call_count == 0
+        assert second == first
+        assert len(list(isolated_stub_cache.glob("*.pyi"))) == 1
+
+    def test_disk_cache_opt_out(self, isolated_stub_cache, monkeypatch, mocker) -> None:
+        """Test that TYPED_PYTEST_GENERATOR_NO_CACHE skips reads and writes."""
+        import subprocess
+
+        from typed_pytest_generator._backend_stubgen import StubgenBackend
+
+        target = "tests.fixtures.sample_classes.UserRepository"
+        StubgenBackend().extract_class_info(UserRepository, target)
+        assert len(list(isolated_stub_cache.glob("*.pyi"))) == 1
+
+        monkeypatch.setenv("TYPED_PYTEST_GENERATOR_NO_CACHE", "1")
+        write_text = mocker.spy(Path, "write_text")
+        run = mocker.spy(subprocess, "run")
+        info = StubgenBackend().extract_class_info(UserRepository, target)
+
+        assert run.call_count == 1
+        assert write_text.call_count == 0
+        assert info.name == "UserRepository"
+
+    def test_disk_cache_misses_after_source_change(
+        self, isolated_stub_cache, mocker
+    ) -> None:
+        """Test that touching the module source invalidates its cached stub."""
+        import os
+        import subprocess
+        import sys
+
+        from typed_pytest_generator._backend_stubgen import StubgenBackend
+
+        target = "tests.fixtures.sample_classes.UserRepository"
+        StubgenBackend().extract_class_info(UserRepository, target)
+        source = Path(sys.modules[UserRepository.__module__].__file__)
+        stat = source.stat()
+        run = mocker.spy(subprocess, "run")
+        try:
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            StubgenBackend().extract_class_info(UserRepository, target)
+        finally:
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert run.call_count == 1
+
     def test_is_stub_backend(self, stubgen_backend) -> None:
         """Test that StubgenBackend is a StubBackend."""
         assert isinstance(stubgen_backend, StubBackend)
@@ -182,7 +182,17 @@ class TestMergeWithCli:
             cli_exclude_targets=["shared.Class", "other.Class"]
         )
 
-        assert set(merged.exclude_targets) == {"shared.Class", "other.Class"}
+        assert merged.exclude_targets == ["shared.Class", "other.Class"]
+
+    def test_merged_exclude_targets_keep_order(self) -> None:
+        """Merged exclude targets keep config order, then CLI order."""
+        config = GeneratorConfig(exclude_targets=["b.Config", "a.Config"])
+
+        merged = config.merge_with_cli(
+            cli_exclude_targets=["d.Cli", "b.Config", "c.Cli"]
+        )
+
+        assert merged.exclude_targets == ["b.Config", "a.Config", "d.Cli", "c.Cli"]
 
     def test_full_merge_scenario(self) -> None:
         """Complete merge scenario with all options."""
@@ -330,6 +340,45 @@ class TestLoadConfigFromToml:
             with pytest.raises(ConfigLoadError, match="Invalid TOML"):
                 load_config_from_toml(pyproject)
 
+    def test_repeated_loads_return_independent_configs(self) -> None:
+        """A cached parse still yields a fresh config per call."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pyproject = Path(tmpdir) / "pyproject.toml"
+            pyproject.write_text(
+                dedent("""
+                [tool.typed-pytest-generator]
+                targets = ["myapp.A"]
+            """)
+            )
+
+            first = load_config_from_toml(pyproject)
+            first.targets.append("myapp.B")
+            second = load_config_from_toml(pyproject)
+
+            assert second is not first
+            assert second.targets == ["myapp.A"]
+
+    def test_reloads_after_file_changes(self) -> None:
+        """Editing the file invalidates the cached parse."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pyproject = Path(tmpdir) / "pyproject.toml"
+            pyproject.write_text(
+                dedent("""
+                [tool.typed-pytest-generator]
+                targets = ["myapp.A"]
+            """)
+            )
+            load_config_from_toml(pyproject)
+
+            pyproject.write_text(
+                dedent("""
+                [tool.typed-pytest-generator]
+                targets = ["myapp.A", "myapp.B"]
+            """)
+            )
+
+            assert load_config_from_toml(pyproject).targets == ["myapp.A", "myapp.B"]
+
 
 class TestParseConfigDict:
     """Tests for _parse_config_dict()."""
@@ -113,6 +113,28 @@ class TestTypedMockFactoryErrors:
         with pytest.raises(TypeError, match="must be a class"):
             typed_mock(None)  # type: ignore[arg-type]
 
+    def test_abc_class_accepted(self) -> None:
+        """Classes created by ABCMeta are accepted."""
+        from abc import ABC, abstractmethod
+
+        class AbstractService(ABC):
+            @abstractmethod
+            def run(self) -> int: ...
+
+        mock = typed_mock(AbstractService)
+        mock.run.return_value = 1
+        assert mock.run() == 1
+
+    def test_custom_metaclass_accepted(self) -> None:
+        """Classes with a custom metaclass fall back to isinstance()."""
+        from enum import Enum
+
+        class Color(Enum):
+            RED = 1
+
+        mock = typed_mock(Color)
+        assert mock.typed_class is Color
+
 
 class TestTypedMockFactoryStrict:
     """typed_mock strict option tests (future implementation)."""
@@ -2,87 +2,20 @@
 
 from __future__ import annotations
 
+import os
 import tempfile
 from pathlib import Path
 
-from typed_pytest_generator._generator import StubGenerator, generate_stubs
-from typed_pytest_generator._inspector import inspect_class
-
-
-class TestInspectClass:
-    """Tests for class inspection."""
-
-    def test_inspects_regular_methods(self):
-        """Regular methods are correctly identified."""
-        from tests.fixtures.sample_classes import UserService
-
-        methods = inspect_class(UserService)
-
-        method_names = [m.name for m in methods]
-        assert "get_user" in method_names
-        assert "create_user" in method_names
-        assert "delete_user" in method_names
-
-    def test_inspects_async_methods(self):
-        """Async methods are correctly identified."""
-        from tests.fixtures.sample_classes import UserService
-
-        methods = inspect_class(UserService)
-        async_methods = [m for m in methods if m.method_type == "async"]
-
-        async_names = [m.name for m in async_methods]
-        assert "async_get_user" in async_names
-        assert "async_create_user" in async_names
-
-    def test_inspects_properties(self):
-        """Properties are correctly identified."""
-        from tests.fixtures.sample_classes import UserService
-
-        methods = inspect_class(UserService)
-        properties = [m for m in methods if m.method_type == "property"]
-
-        prop_names = [m.name for m in properties]
-        assert "connection_status" in prop_names
-        assert "is_connected" in prop_names
-
-    def test_inspects_classmethods(self):
-        """Class methods are correctly identified."""
-        from tests.fixtures.sample_classes import UserService
-
-        methods = inspect_class(UserService)
-        classmethods = [m for m in methods if m.method_type == "classmethod"]
-
-        assert len(classmethods) == 1
-        assert classmethods[0].name == "from_config"
-
-    def test_inspects_staticmethods(self):
-        """Static methods are correctly identified."""
-        from tests.fixtures.sample_classes import UserService
-
-        methods = inspect_class(UserService)
-        staticmethods = [m for m in methods if m.method_type == "staticmethod"]
-
-        assert len(staticmethods) == 1
-        assert staticmethods[0].name == "validate_email"
+import pytest
 
-    def test_excludes_private_methods_by_default(self):
-        """Private methods are excluded by default."""
-        from tests.fixtures.sample_classes import UserService
-
-        methods = inspect_class(UserService)
-        method_names = [m.name for m in methods]
-
-        assert not any(name.startswith("_") for name in method_names)
+from typed_pytest_generator._generator import StubGenerator, generate_stubs
 
-    def test_includes_private_methods_when_enabled(self):
-        """Private methods are included when flag is set."""
-        from tests.fixtures.sample_classes import UserService
 
-        methods = inspect_class(UserService, include_private=True)
-        method_names = [m.name for m in methods]
+class ArrowDefaults:
+    """Has "->" inside a default value."""
 
-        # __init__ should be included
-        assert "__init__" in method_names
+    def join(self, parts: list[str], sep: str = " -> ") -> str:
+        return sep.join(parts)
 
 
 class TestStubGenerator:
@@ -121,6 +54,7 @@ class TestStubGenerator:
 
             # Check for method signatures in _runtime.py
             assert "def get_user(self, user_id: int)" in content
+            assert "    @classmethod\n    def from_config(cls, config:" in content
 
     def test_generated_stub_handles_async(self):
         """Generated stub handles async methods correctly."""
@@ -167,6 +101,19 @@ class TestStubGenerator:
             assert "UserServiceMock" in content
             assert "__all__" in content
 
+    def test_runtime_typed_mock_delegates_to_library(self):
+        """Generated typed_mock delegates to typed_pytest.typed_mock."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generator = StubGenerator(
+                targets=["tests.fixtures.sample_classes.UserService"],
+                output_dir=tmpdir,
+            )
+            generator.generate()
+
+            content = (Path(tmpdir) / "_runtime.py").read_text()
+            assert "from typed_pytest import typed_mock as _typed_mock" in content
+            assert "return _typed_mock(cls, spec_set=spec_set or strict)" in content
+
     def test_generates_multiple_classes(self):
         """Multiple classes can be specified."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -188,6 +135,26 @@ class TestStubGenerator:
             assert "class UserService" in content
             assert "class ProductRepository" in content
 
+    def test_regeneration_leaves_unchanged_files_alone(self):
+        """Re-running with the same targets does not rewrite the outputs."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generator = StubGenerator(
+                targets=["tests.fixtures.sample_classes.UserService"],
+                output_dir=tmpdir,
+            )
+            generated = generator.generate()
+            for path in generated:
+                os.utime(path, ns=(0, 0))
+
+            regenerated = generator.generate()
+
+            assert regenerated == generated
+            assert all(path.stat().st_mtime_ns == 0 for path in regenerated)
+            assert sorted(p.name for p in Path(tmpdir).iterdir()) == [
+                "__init__.py",
+                "_runtime.py",
+            ]
+
     def test_handles_nonexistent_class(self):
         """Nonexistent class is handled gracefully."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -200,6 +167,71 @@ class TestStubGenerator:
             # No files generated for nonexistent class
             assert len(generated) == 0
 
+    def test_walks_each_class_once(self, mocker):
+        """Each target is imported and extracted once for both outputs."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generator = StubGenerator(
+                targets=[
+                    "tests.fixtures.sample_classes.UserService",
+                    "tests.fixtures.sample_classes.ProductRepository",
+                ],
+                output_dir=tmpdir,
+            )
+            import_spy = mocker.spy(generator, "_import_class")
+            extract_spy = mocker.spy(generator.backend, "extract_class_info")
+
+            generator.generate()
+
+            assert import_spy.call_count == 2
+            assert extract_spy.call_count == 2
+
+    def test_skips_class_when_extraction_fails(self, mocker, capsys):
+        """A class the backend cannot handle is reported and left out."""
+        from tests.fixtures.sample_classes import UserService
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generator = StubGenerator(
+                targets=[
+                    "tests.fixtures.sample_classes.UserService",
+                    "tests.fixtures.sample_classes.ProductRepository",
+                ],
+                output_dir=tmpdir,
+            )
+            extract = generator.backend.extract_class_info
+
+            def failing_extract(cls, full_name):
+                if cls is UserService:
+                    raise RuntimeError("boom")
+                return extract(cls, full_name)
+
+            mocker.patch.object(
+                generator.backend, "extract_class_info", side_effect=failing_extract
+            )
+
+            generator.generate()
+
+            content = (Path(tmpdir) / "_runtime.py").read_text()
+            assert "class ProductRepository:" in content
+            assert "class UserService" not in content
+            assert "Error generating stub for" in capsys.readouterr().err
+
+    def test_arrow_in_default_value(self):
+        """Only the return arrow is replaced, not "->" inside defaults."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generator = StubGenerator(
+                targets=["tests.unit.test_generator.ArrowDefaults"],
+                output_dir=tmpdir,
+            )
+            generator.generate()
+
+            runtime_path = Path(tmpdir) / "_runtime.py"
+            content = runtime_path.read_text()
+            compile(content, runtime_path, "exec")
+            assert (
+                "def join(self, parts: list[str], sep: str = ' -> ') -> typing.Any: ..."
+                in content
+            )
+
 
 class TestGenerateStubsFunction:
     """Tests for the convenience function."""
@@ -215,3 +247,23 @@ class TestGenerateStubsFunction:
             assert len(generated) == 2
             assert any(p.name == "__init__.py" for p in generated)
             assert any(p.name == "_runtime.py" for p in generated)
+
+
+class TestPackageExports:
+    """Tests for the package-level lazy exports."""
+
+    def test_all_names_resolve(self):
+        """Every name in __all__ is importable from the package."""
+        import typed_pytest_generator
+
+        for name in typed_pytest_generator.__all__:
+            value = getattr(typed_pytest_generator, name)
+            assert value.__name__ == name
+            assert name in dir(typed_pytest_generator)
+
+    def test_unknown_name_raises(self):
+        """Unknown attributes raise AttributeError."""
+        import typed_pytest_generator
+
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            _ = typed_pytest_generator.missing
@@ -217,6 +217,17 @@ class TestMockedMethod:
         method(2)
         assert method.call_args_list == [call(1), call(2)]
 
+    def test_call_args_list_is_live(self) -> None:
+        """call_args_list is the Mock's own list rather than a copy."""
+        mock = MagicMock()
+        method: MockedMethod[[int], dict] = MockedMethod(mock)
+
+        history = method.call_args_list
+        method(1)
+
+        assert history is mock.call_args_list
+        assert history == [call(1)]
+
     def test_attribute_delegation(self) -> None:
         """Verify attribute delegation works."""
         mock = MagicMock()
@@ -226,6 +237,94 @@ class TestMockedMethod:
         assert hasattr(method, "mock_calls")
         assert method.mock_calls == []
 
+    def test_delegated_attributes_track_mock(self) -> None:
+        """Pre-bound delegated attributes read through to the current Mock."""
+        mock = MagicMock()
+        method: MockedMethod[[int], dict] = MockedMethod(mock)
+
+        method(1)
+        method.configure_mock(return_value=2)
+
+        assert method.mock_calls == [call(1)]
+        assert method.method_calls == []
+        assert method() == 2
+
+    def test_delegated_private_mock_attributes(self) -> None:
+        """_mock_name and _mock_children read through to the Mock."""
+        mock = MagicMock(name="svc")
+        method: MockedMethod[[int], dict] = MockedMethod(mock)
+
+        _ = mock.child
+        assert method._mock_name == "svc"  # noqa: SLF001
+        assert "child" in method._mock_children  # noqa: SLF001
+
+    def test_setattr_always_delegates(self) -> None:
+        """Every attribute assignment is forwarded to the wrapped Mock."""
+        mock = MagicMock()
+        method: MockedMethod[[int], dict] = MockedMethod(mock)
+
+        method.return_value = {"id": 1}
+        method.custom = "value"  # type: ignore[attr-defined]
+
+        assert mock.return_value == {"id": 1}
+        assert mock.custom == "value"
+
+    def test_dunder_lookup_skips_mock_getattr(self) -> None:
+        """Missing dunders raise; dunders the Mock really has are returned."""
+        mock = MagicMock()
+        method: MockedMethod[[int], dict] = MockedMethod(mock)
+
+        with pytest.raises(AttributeError):
+            _ = method.__wrapped__
+        assert method.__iter__ == mock.__iter__
+
+    def test_dir_lists_wrapper_and_mock_children(self) -> None:
+        """dir() shows wrapper members and Mock children, not Mock internals."""
+        mock = MagicMock()
+        mock.child.return_value = 1
+        method: MockedMethod[[int], dict] = MockedMethod(mock)
+
+        names = dir(method)
+
+        assert "assert_called_once_with" in names
+        assert "return_value" in names
+        assert "child" in names
+        assert "_mock_wraps" not in names
+
+    def test_subscription_returns_class(self) -> None:
+        """Subscripting is erased at runtime and returns the class itself."""
+        assert MockedMethod[[int], dict] is MockedMethod
+        assert AsyncMockedMethod[[int], dict] is AsyncMockedMethod
+
+        method = MockedMethod[[int], dict](MagicMock(return_value={}))
+        assert method(1) == {}
+
+    @pytest.mark.parametrize("wrapper", [MockedMethod, AsyncMockedMethod])
+    def test_instances_have_no_dict(self, wrapper: type) -> None:
+        """Every class in the wrapper MRO declares __slots__."""
+        method = wrapper(AsyncMock())
+
+        assert all("__slots__" in vars(klass) for klass in wrapper.__mro__[:-1])
+        with pytest.raises(AttributeError):
+            object.__getattribute__(method, "__dict__")
+
+    def test_generic_not_in_runtime_mro(self) -> None:
+        """typing.Generic is only seen by type checkers."""
+        from typing import Generic
+
+        assert Generic not in MockedMethod.__mro__
+        assert Generic not in AsyncMockedMethod.__mro__
+
+    def test_async_compat_asserts(self) -> None:
+        """Awaited asserts pass for sync Mocks and check AsyncMocks."""
+        sync_method: MockedMethod[[int], dict] = MockedMethod(MagicMock())
+        sync_method.assert_awaited()
+        sync_method.assert_awaited_once_with(1)
+
+        async_method: MockedMethod[[int], dict] = MockedMethod(AsyncMock())
+        with pytest.raises(AssertionError):
+            async_method.assert_awaited()
+
 
 class TestAsyncMockedMethod:
     """AsyncMockedMethod 테스트."""
@@ -236,6 +335,19 @@ class TestAsyncMockedMethod:
         method: AsyncMockedMethod[[int], dict] = AsyncMockedMethod(mock)
         assert method is not None
 
+    async def test_call_returns_mock_coroutine(self) -> None:
+        """Calling returns the AsyncMock's coroutine without another wrapper."""
+        import asyncio
+
+        mock = AsyncMock(return_value=1)
+        method: AsyncMockedMethod[[int], int] = AsyncMockedMethod(mock)
+
+        coro = method(1)
+
+        assert asyncio.iscoroutine(coro)
+        assert await coro == 1
+        mock.assert_awaited_once_with(1)
+
     async def test_async_call(self) -> None:
         """비동기 호출."""
         mock = AsyncMock()
@@ -337,6 +449,16 @@ class TestAsyncMockedMethod:
         with pytest.raises(AssertionError):
             method.assert_any_await(3)
 
+    async def test_assert_has_calls(self) -> None:
+        """assert_has_calls is shared with MockedMethod."""
+        mock = AsyncMock()
+        method: AsyncMockedMethod[[int], dict] = AsyncMockedMethod(mock)
+
+        await method(1)
+        await method(2)
+
+        method.assert_has_calls([call(1), call(2)])
+
     async def test_assert_not_awaited(self) -> None:
         """assert_not_awaited 메소드."""
         mock = AsyncMock()
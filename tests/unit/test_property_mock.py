@@ -1,9 +1,11 @@
 """MockedProperty, MockedClassMethod, and MockedStaticMethod tests."""
 
+from typing import Any
 from unittest.mock import MagicMock, call
 
 import pytest
 
+from typed_pytest._method import _MockMethodBase
 from typed_pytest._property import (
     MockedClassMethod,
     MockedProperty,
@@ -126,6 +128,30 @@ class TestMockedProperty:
         assert hasattr(prop, "mock_calls")
         assert prop.mock_calls == []
 
+    def test_dunder_lookup_skips_mock_getattr(self) -> None:
+        """Missing dunders raise; dunders the Mock really has are returned."""
+        mock = MagicMock()
+        prop: MockedProperty[str] = MockedProperty(mock)
+
+        with pytest.raises(AttributeError):
+            _ = prop.__wrapped__
+        assert prop.__iter__ == mock.__iter__
+
+    def test_dir_lists_wrapper_members(self) -> None:
+        """dir() includes the wrapper's own members."""
+        prop: MockedProperty[str] = MockedProperty(MagicMock())
+
+        assert {"return_value", "assert_called", "call_args_list"} <= set(dir(prop))
+
+    def test_setattr_always_delegates(self) -> None:
+        """Every attribute assignment is forwarded to the wrapped Mock."""
+        mock = MagicMock()
+        prop: MockedProperty[str] = MockedProperty(mock)
+
+        prop.custom = "value"  # type: ignore[attr-defined]
+
+        assert mock.custom == "value"
+
     def test_side_effect_callable(self) -> None:
         """side_effect with callable."""
         mock = MagicMock()
@@ -184,6 +210,7 @@ class TestMockedProperty:
         mock("second")
 
         assert len(prop.call_args_list) == 2
+        assert prop.call_args_list is mock.call_args_list
 
     def test_assert_any_call(self) -> None:
         """assert_any_call method."""
@@ -310,6 +337,18 @@ class TestMockedClassMethod:
         method.reset_mock()
         assert method.call_count == 0
 
+    def test_asserts_track_mock_after_reset(self) -> None:
+        """Pre-bound assertions see calls made after reset_mock."""
+        mock = MagicMock()
+        method: MockedClassMethod[[int], str] = MockedClassMethod(mock)
+
+        method(1)
+        method.reset_mock()
+        method.assert_not_called()
+
+        mock(2)
+        method.assert_called_once_with(2)
+
     def test_call_args(self) -> None:
         """call_args property."""
         mock = MagicMock()
@@ -569,3 +608,23 @@ class TestMockedStaticMethod:
 
         assert hasattr(method, "mock_calls")
         assert method.mock_calls == []
+
+
+@pytest.mark.parametrize("wrapper_cls", [MockedClassMethod, MockedStaticMethod])
+def test_method_wrappers_share_method_base(
+    wrapper_cls: type[_MockMethodBase[..., Any]],
+) -> None:
+    """Class and static method wrappers reuse the MockedMethod machinery."""
+    wrapper = wrapper_cls(MagicMock())
+
+    assert isinstance(wrapper, _MockMethodBase)
+    with pytest.raises(AttributeError):
+        object.__getattribute__(wrapper, "__dict__")
+
+
+def test_mocked_property_subscription_returns_class() -> None:
+    """Subscripting MockedProperty is erased at runtime."""
+    from typing import Generic
+
+    assert MockedProperty[int] is MockedProperty
+    assert Generic not in MockedProperty.__mro__
@@ -4,7 +4,13 @@ from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 
-from typed_pytest._protocols import AsyncMockProtocol, MockProtocol
+from typed_pytest._protocols import (
+    AsyncMockProtocol,
+    MockProtocol,
+    is_async_mock_protocol,
+    is_mock,
+    is_mock_protocol,
+)
 
 
 class TestMockProtocol:
@@ -331,3 +337,36 @@ class TestAsyncMockProtocol:
         await mock(1)
         await mock(2)
         assert mock.await_args_list == [call(1), call(2)]
+
+
+class TestIsMock:
+    """is_mock() 테스트."""
+
+    @pytest.mark.parametrize("factory", [MagicMock, AsyncMock])
+    def test_mock_instances(self, factory: type) -> None:
+        """unittest.mock 인스턴스는 True."""
+        assert is_mock(factory())
+
+    def test_typed_mock(self) -> None:
+        """TypedMock도 Mock 인스턴스로 인식되는지 확인."""
+        from typed_pytest import typed_mock
+
+        assert is_mock(typed_mock(dict))
+
+    def test_non_mock(self) -> None:
+        """Mock이 아닌 객체는 False."""
+        assert not is_mock(object())
+        assert not is_mock(MagicMock)
+
+
+class TestIsMockProtocol:
+    """is_mock_protocol() / is_async_mock_protocol() 테스트."""
+
+    def test_matches_isinstance(self) -> None:
+        """결과가 isinstance() 검사와 일치하는지 확인."""
+        from typed_pytest import MockedMethod
+
+        candidates = [MagicMock(), AsyncMock(), MockedMethod(MagicMock()), object()]
+        for obj in candidates:
+            assert is_mock_protocol(obj) == isinstance(obj, MockProtocol)
+            assert is_async_mock_protocol(obj) == isinstance(obj, AsyncMockProtocol)
@@ -2,109 +2,124 @@
 
 import shutil
 import tempfile
+from collections.abc import Callable
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-from typed_pytest_generator._generator import StubGenerator, _sanitize_signature
+from typed_pytest_generator._backend_inspect import InspectBackend, _format_default
+from typed_pytest_generator._generator import StubGenerator
 
 
-class TestSanitizeSignature:
-    """Test _sanitize_signature function."""
+class ClassWithClassDefault:
+    """Test class with a class as default parameter value."""
 
-    def test_sanitize_class_default(self) -> None:
-        """Should replace <class '...'> with ..."""
-        sig = "(cls, schema_generator: 'type[Foo]' = <class 'module.Foo'>)"
-        result = _sanitize_signature(sig)
-        assert result == "(cls, schema_generator: 'type[Foo]' = ...)"
+    class InnerClass:
+        pass
 
-    def test_sanitize_function_default(self) -> None:
-        """Should replace <function ...> with ..."""
-        sig = "(self, callback = <function default_callback at 0x123>)"
-        result = _sanitize_signature(sig)
-        assert result == "(self, callback = ...)"
+    @classmethod
+    def method_with_class_default(
+        cls,
+        generator: type = InnerClass,
+        mode: Literal["a", "b"] = "a",
+    ) -> dict:
+        return {}
 
-    def test_sanitize_multiple_invalid_defaults(self) -> None:
-        """Should replace multiple invalid defaults."""
-        sig = "(cls, a = <class 'A'>, b = <function b>)"
-        result = _sanitize_signature(sig)
-        assert result == "(cls, a = ..., b = ...)"
 
-    def test_sanitize_preserves_valid_defaults(self) -> None:
-        """Should preserve valid Python defaults."""
-        sig = "(self, name: str = 'default', count: int = 0, flag: bool = True)"
-        result = _sanitize_signature(sig)
-        assert result == sig  # No change
+class _Sentinel:
+    """Stands in for PydanticUndefined: its repr is a bare identifier."""
 
-    def test_sanitize_mixed_defaults(self) -> None:
-        """Should handle mix of valid and invalid defaults."""
-        sig = "(self, a: str = 'hello', b = <class 'Foo'>, c: int = 42)"
-        result = _sanitize_signature(sig)
-        assert result == "(self, a: str = 'hello', b = ..., c: int = 42)"
+    def __repr__(self) -> str:
+        return "PydanticUndefined"
+
+
+PydanticUndefined = _Sentinel()
+
+
+def default_callback() -> None:
+    """Used as a function default below."""
+
+
+class PydanticLikeModel:
+    """Mimics the defaults of Pydantic's BaseModel.json()."""
 
-    def test_sanitize_undefined_identifier(self) -> None:
+    def json(
+        self,
+        *,
+        include: set[str] | None = None,
+        by_alias: bool = False,
+        encoder: Callable[[Any], Any] | None = PydanticUndefined,  # type: ignore[assignment]
+        models_as_dict: bool = PydanticUndefined,  # type: ignore[assignment]
+        **dumps_kwargs: Any,
+    ) -> str:
+        return ""
+
+    def mixed(self, a: str = "hello", b=ClassWithClassDefault, c: int = 42) -> None:
+        pass
+
+
+class TestFormatDefault:
+    """Test _format_default function."""
+
+    def test_class_default(self) -> None:
+        """Should replace <class '...'> with ..."""
+        assert _format_default(ClassWithClassDefault) == "..."
+
+    def test_function_default(self) -> None:
+        """Should replace <function ...> with ..."""
+        assert _format_default(default_callback) == "..."
+
+    def test_undefined_identifier(self) -> None:
         """Should replace undefined identifiers like PydanticUndefined."""
-        sig = "(self, encoder = PydanticUndefined, models_as_dict = PydanticUndefined)"
-        result = _sanitize_signature(sig)
-        assert result == "(self, encoder = ..., models_as_dict = ...)"
+        assert _format_default(PydanticUndefined) == "..."
 
-    def test_sanitize_camelcase_identifier(self) -> None:
-        """Should replace CamelCase identifiers that are likely undefined."""
-        sig = "(cls, schema_generator: type = GenerateJsonSchema)"
-        result = _sanitize_signature(sig)
-        assert result == "(cls, schema_generator: type = ...)"
+    def test_preserves_valid_defaults(self) -> None:
+        """Should preserve valid Python defaults."""
+        assert _format_default("default") == "'default'"
+        assert _format_default(0) == "0"
+        assert _format_default(True) == "True"
 
-    def test_sanitize_preserves_none_default(self) -> None:
+    def test_preserves_none_default(self) -> None:
         """Should preserve None as a default value."""
-        sig = "(self, value: str | None = None)"
-        result = _sanitize_signature(sig)
-        assert result == "(self, value: str | None = None)"
+        assert _format_default(None) == "None"
 
-    def test_sanitize_preserves_empty_collections(self) -> None:
+    def test_preserves_empty_collections(self) -> None:
         """Should preserve empty collections as defaults."""
-        sig = "(self, items: list = [], data: dict = {})"
-        result = _sanitize_signature(sig)
-        assert result == "(self, items: list = [], data: dict = {})"
+        assert _format_default([]) == "[]"
+        assert _format_default({}) == "{}"
+        assert _format_default(()) == "()"
+        assert _format_default(set()) == "set()"
 
-    def test_sanitize_preserves_negative_numbers(self) -> None:
+    def test_preserves_negative_numbers(self) -> None:
         """Should preserve negative numbers."""
-        sig = "(self, offset: int = -1, factor: float = -0.5)"
-        result = _sanitize_signature(sig)
-        assert result == "(self, offset: int = -1, factor: float = -0.5)"
+        assert _format_default(-1) == "-1"
+        assert _format_default(-0.5) == "-0.5"
 
-    def test_sanitize_pydantic_json_method(self) -> None:
-        """Should handle Pydantic's json method with PydanticUndefined defaults."""
-        sig = (
-            "(self, *, include: 'IncEx | None' = None, exclude: 'IncEx | None' = None, "
-            "by_alias: 'bool' = False, exclude_unset: 'bool' = False, "
-            "exclude_defaults: 'bool' = False, exclude_none: 'bool' = False, "
-            "encoder: 'Callable[[Any], Any] | None' = PydanticUndefined, "
-            "models_as_dict: 'bool' = PydanticUndefined, **dumps_kwargs: 'Any')"
+
+class TestSignatureDefaults:
+    """Test default values in signatures built by InspectBackend."""
+
+    def _signature(self, name: str) -> str:
+        info = InspectBackend().extract_class_info(PydanticLikeModel, "m.Model")
+        return next(m.signature for m in info.methods if m.name == name)
+
+    def test_mixed_defaults(self) -> None:
+        """Should handle mix of valid and invalid defaults."""
+        assert self._signature("mixed") == (
+            "(self, a: str = 'hello', b=..., c: int = 42) -> typing.Any"
         )
-        result = _sanitize_signature(sig)
+
+    def test_pydantic_json_method(self) -> None:
+        """Should handle Pydantic's json method with PydanticUndefined defaults."""
+        result = self._signature("json")
         # PydanticUndefined should be replaced with ...
         assert "PydanticUndefined" not in result
-        assert "encoder: 'Callable[[Any], Any] | None' = ..." in result
-        assert "models_as_dict: 'bool' = ..." in result
+        assert "encoder: Callable[[typing.Any], typing.Any] | None = ..." in result
+        assert "models_as_dict: bool = ..." in result
         # Valid defaults should be preserved
         assert "= None" in result
         assert "= False" in result
 
 
-class ClassWithClassDefault:
-    """Test class with a class as default parameter value."""
-
-    class InnerClass:
-        pass
-
-    @classmethod
-    def method_with_class_default(
-        cls,
-        generator: type = InnerClass,
-        mode: Literal["a", "b"] = "a",
-    ) -> dict:
-        return {}
-
-
 class TestStubGenerationWithInvalidDefaults:
     """Test that stub generation handles invalid defaults."""
 
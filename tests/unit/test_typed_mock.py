@@ -57,6 +57,13 @@ class TestTypedMockGenericSyntax:
         MockType = TypedMock[UserService]
         assert MockType is not None
 
+    def test_generic_erased_at_runtime(self) -> None:
+        """typing.Generic is not in the runtime MRO; subscription returns the class."""
+        from typing import Generic
+
+        assert TypedMock[UserService] is TypedMock
+        assert Generic not in type(TypedMock(spec=UserService)).__mro__
+
     def test_generic_type_annotation(self) -> None:
         """Verify generic type annotation works."""
         mock = typed_mock(UserService)
@@ -174,6 +181,15 @@ class TestTypedMockRepr:
 
         assert "TypedMock" in repr_str
 
+    def test_repr_tracks_name_change(self) -> None:
+        """Cached repr is rebuilt when the mock's name changes."""
+        mock = typed_mock(UserService)
+        first = repr(mock)
+        assert repr(mock) == first
+
+        mock._mock_name = "renamed"  # noqa: SLF001
+        assert repr(mock) == "<TypedMock[UserService] name='renamed'>"
+
 
 class TestTypedMockChildMock:
     """TypedMock child Mock tests."""
@@ -186,6 +202,103 @@ class TestTypedMockChildMock:
         # Child is MagicMock but not TypedMock
         assert isinstance(child, MagicMock)
 
+    def test_async_child_follows_mro(self) -> None:
+        """The first class in the MRO defining a name decides sync vs async."""
+        from unittest.mock import AsyncMock
+
+        class Base:
+            async def fetch(self) -> int:
+                return 1
+
+            async def close(self) -> None: ...
+
+        class Sync(Base):
+            def fetch(self) -> int:  # type: ignore[override]
+                return 1
+
+        mock = TypedMock(spec=Sync)
+
+        assert not isinstance(mock.fetch, AsyncMock)
+        assert isinstance(mock.close, AsyncMock)
+
+
+class TestTypedMockSpecCache:
+    """TypedMock spec introspection cache tests."""
+
+    def test_mocks_do_not_share_spec_state(self) -> None:
+        """Mocks of the same class get independent spec lists."""
+        first = TypedMock(spec=UserService)
+        second = TypedMock(spec=UserService)
+
+        first.mock_add_spec(["only_this"])
+
+        assert hasattr(second, "get_user")
+        assert not hasattr(first, "get_user")
+
+    def test_class_modified_after_first_mock(self) -> None:
+        """Attributes added to the class after caching are visible."""
+
+        class Service:
+            def run(self) -> int:
+                return 1
+
+        TypedMock(spec=Service)
+        Service.stop = lambda self: None  # type: ignore[attr-defined]
+
+        mock = TypedMock(spec=Service)
+        assert hasattr(mock, "stop")
+
+    def test_method_replaced_with_async(self) -> None:
+        """Replacing a method with a coroutine function updates async children."""
+        from unittest.mock import AsyncMock
+
+        class Service:
+            def run(self) -> int:
+                return 1
+
+        TypedMock(spec=Service)
+
+        async def run(self: Service) -> int:
+            return 1
+
+        Service.run = run  # type: ignore[method-assign]
+
+        mock = TypedMock(spec=Service)
+        assert isinstance(mock.run, AsyncMock)
+
+    def test_attribute_renamed_with_same_value(self) -> None:
+        """Moving a value to a different name invalidates the cached spec."""
+
+        def go(self: object) -> None: ...
+
+        class Service:
+            pass
+
+        Service.go = go  # type: ignore[attr-defined]
+        TypedMock(spec=Service)
+        del Service.go  # type: ignore[attr-defined]
+        Service.stop = go  # type: ignore[attr-defined]
+
+        mock = TypedMock(spec=Service)
+
+        assert hasattr(mock, "stop")
+        assert not hasattr(mock, "go")
+
+    @pytest.mark.parametrize("spec_set", [False, True])
+    def test_cached_spec_matches_magicmock(self, *, spec_set: bool) -> None:
+        """A cache hit leaves the same spec state as a plain MagicMock."""
+        kwargs = {"spec_set" if spec_set else "spec": UserService}
+        TypedMock(**kwargs)
+        cached = TypedMock(**kwargs)
+        plain = MagicMock(**kwargs)
+
+        spec_keys = {
+            key for key in plain.__dict__ if key.startswith(("_spec", "_mock_methods"))
+        }
+        assert spec_keys >= {"_spec_class", "_spec_signature", "_mock_methods"}
+        for key in spec_keys:
+            assert cached.__dict__[key] == plain.__dict__[key], key
+
 
 class TestTypedMockRealScenarios:
     """TypedMock 실제 사용 시나리오 테스트."""
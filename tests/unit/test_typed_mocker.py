@@ -32,6 +32,15 @@ class TestTypedMockerCreation:
 
         assert typed_mocker.mocker is mocker
 
+    def test_mocker_property_is_read_only(self, mocker: MockerFixture) -> None:
+        """mocker cannot be reassigned away from the bound wrappers."""
+        typed_mocker = TypedMocker(mocker)
+
+        with pytest.raises(AttributeError):
+            typed_mocker.mocker = mocker  # type: ignore[misc]
+
+        assert typed_mocker.mocker is mocker
+
 
 class TestTypedMockerMock:
     """TypedMocker.mock() 메소드 테스트."""
@@ -90,6 +99,20 @@ class TestTypedMockerMock:
         assert result == {"id": 1, "name": "Test"}
         mock.get_user.assert_called_once_with(1)
 
+    def test_mock_reuses_spec_but_not_instances(self, mocker: MockerFixture) -> None:
+        """Repeated mock() calls share the cached spec, not mock state."""
+        from typed_pytest._mock import _SPEC_CACHE
+
+        typed_mocker = TypedMocker(mocker)
+        first = typed_mocker.mock(UserService)
+        cached = _SPEC_CACHE[UserService]
+        second = typed_mocker.mock(UserService)
+
+        assert _SPEC_CACHE[UserService] is cached
+        assert first is not second
+        first.get_user(1)
+        second.get_user.assert_not_called()
+
 
 class TestTypedMockerPatch:
     """TypedMocker.patch() 메소드 테스트."""